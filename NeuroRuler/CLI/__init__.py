@@ -7,7 +7,6 @@ where NeuroRuler.CLI is the name of the package this __init__.py file is in."""
 import shutil
 from pathlib import Path
 import pkg_resources
-import NeuroRuler.CLI.main as main
 import NeuroRuler.utils.parser as parser
 import NeuroRuler.utils.constants as constants
 
@@ -25,4 +24,7 @@ def cli() -> None:
 
     parser.parse_cli_config()
     parser.parse_cli()
+    # Imported after parsing so that --help and invalid arguments don't import OpenCV, etc.
+    import NeuroRuler.CLI.main as main
+
     main.main()
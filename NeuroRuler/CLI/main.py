@@ -23,6 +23,7 @@ from NeuroRuler.utils.img_helpers import (
 
 def main() -> None:
     """Main entrypoint of CLI."""
+    sitk.ProcessObject.SetGlobalDefaultNumberOfThreads(constants.NUM_ITK_THREADS)
     file_path = Path(cli_settings.FILE)
 
     initialize_globals([file_path])
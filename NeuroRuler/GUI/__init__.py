@@ -9,7 +9,6 @@ import os
 import shutil
 from pathlib import Path
 import pkg_resources
-import NeuroRuler.GUI.main as main
 import NeuroRuler.utils.parser as parser
 import NeuroRuler.utils.constants as constants
 
@@ -56,4 +55,7 @@ def gui() -> None:
 
     parser.parse_gui_config()
     parser.parse_gui_cli()
+    # Imported after parsing so that --help and invalid arguments don't import PyQt6, OpenCV, etc.
+    import NeuroRuler.GUI.main as main
+
     main.main()
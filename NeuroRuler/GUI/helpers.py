@@ -26,6 +26,7 @@ from PyQt6.QtCore import Qt
 import qimage2ndarray
 
 import NeuroRuler.utils.exceptions as exceptions
+from NeuroRuler.utils.img_helpers import slice_to_uint8_array
 import NeuroRuler.utils.gui_settings as user_settings
 from NeuroRuler.utils.constants import deprecated
 
@@ -64,13 +65,19 @@ def mask_QImage(q_img: QImage, binary_mask: np.ndarray, color: QColor) -> None:
     to change ``q_img`` pixels corresponding to ``binary_mask``=1 to ``color``. Mutates ``q_img``.
 
     QImage and numpy use [reversed w,h order](https://stackoverflow.com/a/68220805/18479243).
+    ``binary_mask`` is in numpy order, i.e. the same shape as ``sitk.GetArrayFromImage`` of the slice
+    (e.g., the RV of ``imgproc.contour()``), so it doesn't need to be transposed before calling this.
 
     This function checks that
-    ``q_img.size().width() == binary_mask.shape[0]`` and ``q_img.size().height() == binary_mask.shape[1]``.
+    ``q_img.size().width() == binary_mask.shape[1]`` and ``q_img.size().height() == binary_mask.shape[0]``.
 
-    :param q_img:
+    Pixels are written through a numpy view of ``q_img``'s buffer (``qimage2ndarray.rgb_view``)
+    instead of calling ``setPixelColor`` for each pixel, so ``q_img`` must have a 32-bit format,
+    e.g. the RV of ``sitk_slice_to_qimage``.
+
+    :param q_img: 32-bit QImage
     :type q_img: QImage
-    :param binary_mask: 0|1 elements
+    :param binary_mask: 0|1 elements, shape (height, width)
     :type binary_mask: np.ndarray
     :param color:
     :type color: QColor
@@ -78,29 +85,41 @@ def mask_QImage(q_img: QImage, binary_mask: np.ndarray, color: QColor) -> None:
     :return: None
     :rtype: None"""
     if (
-        q_img.size().width() != binary_mask.shape[0]
-        or q_img.size().height() != binary_mask.shape[1]
+        q_img.size().width() != binary_mask.shape[1]
+        or q_img.size().height() != binary_mask.shape[0]
     ):
         raise exceptions.ArraysDifferentShape
-    for i in range(binary_mask.shape[0]):
-        for j in range(binary_mask.shape[1]):
-            if binary_mask[i][j]:
-                q_img.setPixelColor(i, j, color)
+    # (height, width, 3) view, same order as binary_mask
+    rgb: np.ndarray = qimage2ndarray.rgb_view(q_img)
+    rgb[binary_mask != 0] = (color.red(), color.green(), color.blue())
 
 
 def sitk_slice_to_qimage(sitk_slice: sitk.Image) -> QImage:
     """Convert a 2D sitk.Image slice to a QImage.
 
-    This function calls sitk.GetArrayFromImage, which returns the transpose.
-    It also calls qimage2ndarray.array2qimage with normalize=True, normalizing
-    the pixels to 0..255.
+    The pixels are normalized to 0..255 (min to 0, max to 255) by ``img_helpers.slice_to_uint8_array``,
+    like qimage2ndarray.array2qimage's normalize=True, but in float32 and converted to uint8 before
+    calling array2qimage. array2qimage's normalization works in float64 and converts again when
+    filling the QImage.
 
     :param sitk_slice: 2D slice
     :type sitk_slice: sitk.Image
     :return: 0..255 normalized QImage
     :rtype: QImage"""
-    slice_np: np.ndarray = sitk.GetArrayFromImage(sitk_slice)
-    return qimage2ndarray.array2qimage(slice_np, normalize=True)
+    return uint8_array_to_qimage(slice_to_uint8_array(sitk_slice))
+
+
+def uint8_array_to_qimage(slice_uint8: np.ndarray) -> QImage:
+    """Convert a 0..255 uint8 array (e.g., RV of ``img_helpers.slice_to_uint8_array``) to a QImage.
+
+    The QImage has its own copy of the pixels, so mutating it (e.g., ``mask_QImage``)
+    doesn't mutate ``slice_uint8``.
+
+    :param slice_uint8: shape (height, width)
+    :type slice_uint8: np.ndarray
+    :return: QImage
+    :rtype: QImage"""
+    return qimage2ndarray.array2qimage(slice_uint8)
 
 
 class ErrorMessageBox(QMessageBox):
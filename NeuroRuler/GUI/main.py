@@ -13,12 +13,13 @@ then you will need to modify those."""
 
 
 import importlib
+import io
 import sys
 import os
 import json
 import webbrowser
 from pathlib import Path
-from typing import Union
+from typing import List, Union
 
 import SimpleITK as sitk
 import numpy as np
@@ -35,9 +36,10 @@ from PyQt6.QtWidgets import (
     QVBoxLayout,
     QWidget,
     QMessageBox,
+    QSlider,
 )
 from PyQt6.uic.load_ui import loadUi
-from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtCore import Qt, QSize, QTimer
 
 import pprint
 import pkg_resources
@@ -54,6 +56,7 @@ from NeuroRuler.GUI.helpers import (
     string_to_QColor,
     mask_QImage,
     sitk_slice_to_qimage,
+    uint8_array_to_qimage,
     ErrorMessageBox,
     InformationDialog,
 )
@@ -64,6 +67,7 @@ from NeuroRuler.utils.img_helpers import (
     get_curr_image,
     get_curr_image_size,
     get_curr_rotated_slice,
+    get_curr_rotated_slice_uint8,
     get_curr_smooth_slice,
     get_curr_metadata,
     get_curr_binary_thresholded_slice,
@@ -82,16 +86,16 @@ if not PATH_TO_UI_FILE.exists():
     PATH_TO_UI_FILE = Path(
         pkg_resources.resource_filename("NeuroRuler.GUI", "mainwindow.ui")
     )
+UI_FILE_BYTES: bytes = PATH_TO_UI_FILE.read_bytes()
+"""Contents of PATH_TO_UI_FILE, read once so each MainWindow() doesn't read the file again."""
 PATH_TO_NR_LOGO: Path = Path("NeuroRuler") / "GUI" / "static" / "nr_logo.png"
 if not PATH_TO_NR_LOGO.exists():
     PATH_TO_NR_LOGO = Path(
-        pkg_resources.resource_filename("NeuroRuler.GUI", "static/nr_logo.png") # TODO: pkg_resources is deprecated
+        pkg_resources.resource_filename(
+            "NeuroRuler.GUI", "static/nr_logo.png"
+        )  # TODO: pkg_resources is deprecated
     )
 
-SETTINGS_VIEW_ENABLED: bool = True
-"""Whether the user is able to adjust settings (settings screen) or not
-(circumference and contoured image screen)."""
-
 DEFAULT_CIRCUMFERENCE_LABEL_TEXT: str = "Calculated Circumference: N/A"
 DEFAULT_IMAGE_PATH_LABEL_TEXT: str = "Image path"
 GITHUB_LINK: str = "https://github.com/NIRALUser/NeuroRuler"
@@ -99,16 +103,17 @@ DOCUMENTATION_LINK: str = "https://NeuroRuler.readthedocs.io/en/latest/"
 DEFAULT_IMAGE_TEXT: str = "Select images using File > Open!"
 DEFAULT_IMAGE_NUM_LABEL_TEXT: str = "Image 0 of 0"
 DEFAULT_IMAGE_STATUS_TEXT: str = "Image path is displayed here."
+OUTPUT_SLICE_EXTENSION: str = "png"
 
-UNSCALED_QPIXMAP: QPixmap
-"""Unscaled QPixmap from which the scaled version is rendered in the GUI.
+RENDER_DEBOUNCE_MS: int = 80
+"""When a slider is moved, wait until it hasn't moved for this many milliseconds before rendering.
 
-When any slice (rotated, smoothed, previewed) is rendered from an unscaled QImage, this variable is set to the
-QPixmap generated from that unscaled QImage.
+Dragging a slider emits valueChanged for every value passed over. This coalesces them into one render."""
 
-This variable will not change on resizeEvent. resizeEvent will scale this. Otherwise, if scaling
-self.image's pixmap (which is already scaled), there would be loss of detail."""
-OUTPUT_SLICE_EXTENSION: str = "png"
+DRAG_PREVIEW_SHRINK_FACTOR: int = 2
+"""While a slider is being dragged, rotated slices are resampled at 1/this resolution along each axis.
+
+The full resolution slice is rendered when the slider is released."""
 
 
 class MainWindow(QMainWindow):
@@ -121,7 +126,19 @@ class MainWindow(QMainWindow):
 
         Sets window title and icon."""
         super(MainWindow, self).__init__()
-        loadUi(str(PATH_TO_UI_FILE), self)
+        loadUi(io.BytesIO(UI_FILE_BYTES), self)
+
+        self.settings_view_enabled: bool = True
+        """Whether the user is able to adjust settings (settings screen) or not
+        (circumference and contoured image screen)."""
+        self.unscaled_qpixmap: QPixmap = QPixmap()
+        """Unscaled QPixmap from which the scaled version is rendered in the GUI.
+
+        When any slice (rotated, smoothed, previewed) is rendered from an unscaled QImage, this is set to the
+        QPixmap generated from that unscaled QImage.
+
+        This will not change on resizeEvent. resizeEvent will scale this. Otherwise, if scaling
+        self.image's pixmap (which is already scaled), there would be loss of detail."""
 
         self.setWindowTitle("NeuroRuler")
 
@@ -170,6 +187,9 @@ class MainWindow(QMainWindow):
         self.y_slider.valueChanged.connect(self.rotate_y)
         self.z_slider.valueChanged.connect(self.rotate_z)
         self.slice_slider.valueChanged.connect(self.slice_update)
+        for slider in (self.x_slider, self.y_slider, self.z_slider, self.slice_slider):
+            slider.sliderPressed.connect(self.slider_pressed)
+            slider.sliderReleased.connect(self.slider_released)
         self.reset_button.clicked.connect(self.reset_settings)
         self.smoothing_preview_button.clicked.connect(self.render_smooth_slice)
         self.otsu_radio_button.clicked.connect(self.disable_binary_threshold_inputs)
@@ -181,6 +201,11 @@ class MainWindow(QMainWindow):
 
         self.export_button.clicked.connect(self.export_json)
 
+        self.render_timer: QTimer = QTimer(self)
+        self.render_timer.setSingleShot(True)
+        self.render_timer.setInterval(RENDER_DEBOUNCE_MS)
+        self.render_timer.timeout.connect(self.render_curr_slice)
+
     def enable_elements(self) -> None:
         """Called after File > Open.
 
@@ -197,8 +222,8 @@ class MainWindow(QMainWindow):
         for widget in self.findChildren(QAction):
             widget.setEnabled(True)
 
-        self.action_export_json.setEnabled(not SETTINGS_VIEW_ENABLED)
-        self.export_button.setEnabled(not SETTINGS_VIEW_ENABLED)
+        self.action_export_json.setEnabled(not self.settings_view_enabled)
+        self.export_button.setEnabled(not self.settings_view_enabled)
         self.disable_binary_threshold_inputs()
 
     def enable_binary_threshold_inputs(self) -> None:
@@ -214,16 +239,14 @@ class MainWindow(QMainWindow):
     def settings_export_view_toggle(self) -> None:
         """Called when clicking Apply (in settings mode) or Adjust (in circumference mode).
 
-        Toggle SETTINGS_VIEW_ENABLED, change apply button text, render stuff depending on the current mode.
+        Toggle self.settings_view_enabled, change apply button text, render stuff depending on the current mode.
 
-        Enables/disables GUI elements depending on the value of SETTINGS_VIEW_ENABLED.
+        Enables/disables GUI elements depending on the value of self.settings_view_enabled.
 
         :return: None
         """
-        # Unsure sure why this is necessary here but nowhere else...
-        global SETTINGS_VIEW_ENABLED
-        SETTINGS_VIEW_ENABLED = not SETTINGS_VIEW_ENABLED
-        settings_view_enabled = SETTINGS_VIEW_ENABLED
+        self.settings_view_enabled = not self.settings_view_enabled
+        settings_view_enabled: bool = self.settings_view_enabled
         if settings_view_enabled:
             self.apply_button.setText("Apply")
             self.circumference_label.setText(DEFAULT_CIRCUMFERENCE_LABEL_TEXT)
@@ -243,10 +266,15 @@ class MainWindow(QMainWindow):
 
             self.update_smoothing_settings(True)
             self.update_binary_filter_settings(True)
-            # Ignore the type annotation warning here.
-            # render_curr_slice() must return np.ndarray since not settings_view_enabled here
-            binary_contour_slice: np.ndarray = self.render_curr_slice()
-            self.render_circumference(binary_contour_slice)
+            # Contouring blocks the event loop, so show that the GUI is busy until the circumference is rendered
+            QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+            try:
+                # Ignore the type annotation warning here.
+                # render_curr_slice() must return np.ndarray since not settings_view_enabled here
+                binary_contour_slice: np.ndarray = self.render_curr_slice()
+                self.render_circumference(binary_contour_slice)
+            finally:
+                QApplication.restoreOverrideCursor()
 
         # Open button is always enabled.
         # If pressing it in circumference mode, then browse_files() will toggle to settings view.
@@ -308,6 +336,8 @@ class MainWindow(QMainWindow):
 
         :return: None
         """
+        # A render scheduled by a slider before the last image was removed has nothing to render
+        self.render_timer.stop()
         central_widget = self.findChildren(QWidget, "centralwidget")[0]
         menubar = self.menuBar()
 
@@ -349,7 +379,7 @@ class MainWindow(QMainWindow):
         :type extend: bool
         :return: None"""
         # If called in circumference mode, then toggle to settings mode.
-        if not SETTINGS_VIEW_ENABLED:
+        if not self.settings_view_enabled:
             self.settings_export_view_toggle()
 
         if path is None:
@@ -527,15 +557,14 @@ class MainWindow(QMainWindow):
     def render_scaled_qpixmap_from_qimage(self, q_img: QImage) -> None:
         """Convert q_img to QPixmap and set self.image's pixmap to that pixmap scaled to self.image's size.
 
-        Sets UNSCALED_PIXMAP to the unscaled pixmap generated from the q_img.
+        Sets self.unscaled_qpixmap to the unscaled pixmap generated from the q_img.
 
         :param q_img:
         :type q_img: QImage
         :return: None"""
-        global UNSCALED_QPIXMAP
-        UNSCALED_QPIXMAP = QPixmap(q_img)
+        self.unscaled_qpixmap = QPixmap(q_img)
         self.image.setPixmap(
-            UNSCALED_QPIXMAP.scaled(
+            self.unscaled_qpixmap.scaled(
                 self.image.size(),
                 aspectRatioMode=Qt.AspectRatioMode.KeepAspectRatio,
                 transformMode=Qt.TransformationMode.SmoothTransformation,
@@ -545,14 +574,14 @@ class MainWindow(QMainWindow):
     def resizeEvent(self, event: QResizeEvent) -> None:
         """This method is called every time the window is resized. Overrides PyQt6's resizeEvent.
 
-        Sets pixmap to UNSCALED_QPIXMAP scaled to self.image's size.
+        Sets pixmap to self.unscaled_qpixmap scaled to self.image's size.
 
         :param event:
         :type event: QResizeEvent
         :return: None"""
         if global_vars.IMAGE_DICT:
             self.image.setPixmap(
-                UNSCALED_QPIXMAP.scaled(
+                self.unscaled_qpixmap.scaled(
                     self.image.size(),
                     aspectRatioMode=Qt.AspectRatioMode.KeepAspectRatio,
                     transformMode=Qt.TransformationMode.SmoothTransformation,
@@ -566,23 +595,30 @@ class MainWindow(QMainWindow):
 
         DOES NOT set text for ``image_num_label`` and file path labels.
 
-        If ``not SETTINGS_VIEW_ENABLED``, also calls ``imgproc.contour()`` and outlines
+        If ``not self.settings_view_enabled``, also calls ``imgproc.contour()`` and outlines
         the contour of the QImage (mutating it).
 
-        Additionally, also returns a view of the binary contoured slice if ``not SETTINGS_VIEW_ENABLED``.
+        Additionally, also returns a view of the binary contoured slice if ``not self.settings_view_enabled``.
         This saves work when computing circumference.
 
-        :return: np.ndarray if ``not SETTINGS_VIEW_ENABLED`` else None
+        Does nothing and returns None if ``IMAGE_DICT`` is empty.
+
+        :return: np.ndarray if ``not self.settings_view_enabled`` else None
         :rtype: np.ndarray or None"""
+        # A render scheduled by a slider would just redo this one
+        self.render_timer.stop()
 
-        if not SETTINGS_VIEW_ENABLED:
+        if not global_vars.IMAGE_DICT:
+            return None
+
+        if not self.settings_view_enabled:
             self.set_view_z()
 
         rotated_slice: sitk.Image = get_curr_rotated_slice()
-        q_img: QImage = sitk_slice_to_qimage(rotated_slice)
+        q_img: QImage = uint8_array_to_qimage(get_curr_rotated_slice_uint8())
         rv_dummy_var: np.ndarray = np.zeros(0)
 
-        if not SETTINGS_VIEW_ENABLED:
+        if not self.settings_view_enabled:
             if self.otsu_radio_button.isChecked():
                 binary_contour_slice: np.ndarray = imgproc.contour(
                     rotated_slice, ThresholdFilter.Otsu
@@ -594,24 +630,29 @@ class MainWindow(QMainWindow):
             rv_dummy_var = binary_contour_slice
             mask_QImage(
                 q_img,
-                np.transpose(binary_contour_slice),
+                binary_contour_slice,
                 string_to_QColor(settings.CONTOUR_COLOR),
             )
 
         elif global_vars.VIEW != constants.View.Z:
             z_indicator: np.ndarray = np.zeros(
-                (rotated_slice.GetSize()[1], rotated_slice.GetSize()[0])
+                (rotated_slice.GetSize()[1], rotated_slice.GetSize()[0]), dtype=bool
             )
-            z_indicator[get_curr_image_size()[2] - global_vars.SLICE - 1, :] = 1
+            # Rows of a downsampled slice are every RESAMPLE_SHRINK_FACTOR'th row of the full slice
+            z_indicator[
+                (get_curr_image_size()[2] - global_vars.SLICE - 1)
+                // global_vars.RESAMPLE_SHRINK_FACTOR,
+                :,
+            ] = True
             mask_QImage(
                 q_img,
-                np.transpose(z_indicator),
+                z_indicator,
                 string_to_QColor(settings.CONTOUR_COLOR),
             )
 
         self.render_scaled_qpixmap_from_qimage(q_img)
 
-        if not SETTINGS_VIEW_ENABLED:
+        if not self.settings_view_enabled:
             return rv_dummy_var
 
     def render_smooth_slice(self) -> None:
@@ -641,18 +682,18 @@ class MainWindow(QMainWindow):
 
     def render_circumference(self, binary_contour_slice: np.ndarray) -> float:
         """Called after pressing Apply or when
-        (not SETTINGS_VIEW_ENABLED and (pressing Next or Previous or Remove Image))
+        (not self.settings_view_enabled and (pressing Next or Previous or Remove Image))
 
         Computes circumference from binary_contour_slice and renders circumference label.
 
         binary_contour_slice is always the return value of render_curr_slice since render_curr_slice must have
         already been called. If calling this function, render_curr_slice must have been called first.
 
-        :param binary_contour_slice: Result of previously calling render_curr_slice when ``not SETTINGS_VIEW_ENABLED``
+        :param binary_contour_slice: Result of previously calling render_curr_slice when ``not self.settings_view_enabled``
         :type binary_contour_slice: np.ndarray
         :return: circumference
         :rtype: float"""
-        if SETTINGS_VIEW_ENABLED:
+        if self.settings_view_enabled:
             raise Exception("Rendering circumference label when SETTINGS_VIEW_ENABLED")
         units: Union[str, None] = get_curr_physical_units()
 
@@ -678,22 +719,20 @@ class MainWindow(QMainWindow):
     def toggle_setting_to_false(self) -> None:
         """Used in testing.
 
-        Flipping the SETTINGS_VIEW_ENABLED
+        Flipping the self.settings_view_enabled
 
         :return: None"""
-        global SETTINGS_VIEW_ENABLED
-        if SETTINGS_VIEW_ENABLED:
-            SETTINGS_VIEW_ENABLED = not SETTINGS_VIEW_ENABLED
+        if self.settings_view_enabled:
+            self.settings_view_enabled = not self.settings_view_enabled
 
     def toggle_setting_to_true(self) -> None:
         """Used in testing.
 
-        Flipping the SETTINGS_VIEW_ENABLED
+        Flipping the self.settings_view_enabled
 
         :return: None"""
-        global SETTINGS_VIEW_ENABLED
-        if not SETTINGS_VIEW_ENABLED:
-            SETTINGS_VIEW_ENABLED = not SETTINGS_VIEW_ENABLED
+        if not self.settings_view_enabled:
+            self.settings_view_enabled = not self.settings_view_enabled
 
     def render_image_num_and_path(self) -> None:
         """Set image_num_label, image_path_label, and status tip of the image.
@@ -706,9 +745,11 @@ class MainWindow(QMainWindow):
         self.image_num_label.setText(
             f"Image {global_vars.CURR_IMAGE_INDEX + 1} of {len(global_vars.IMAGE_DICT)}"
         )
-        self.image_path_label.setText(str(get_curr_path().name))
-        self.image_path_label.setStatusTip(str(get_curr_path()))
-        self.image.setStatusTip(str(get_curr_path()))
+        curr_path: Path = get_curr_path()
+        curr_path_str: str = str(curr_path)
+        self.image_path_label.setText(curr_path.name)
+        self.image_path_label.setStatusTip(curr_path_str)
+        self.image.setStatusTip(curr_path_str)
 
     def render_all_sliders(self) -> None:
         """Sets all slider values to the global rotation and slice values.
@@ -720,12 +761,25 @@ class MainWindow(QMainWindow):
 
         Also updates rotation and slice num labels.
 
+        Slider signals are blocked while setting values. Otherwise, each setValue would call
+        rotate_x, etc., which set the same labels again and schedule a render. Callers render themselves.
+
         :return: None"""
+        sliders: List[QSlider] = [
+            self.x_slider,
+            self.y_slider,
+            self.z_slider,
+            self.slice_slider,
+        ]
+        for slider in sliders:
+            slider.blockSignals(True)
         self.x_slider.setValue(global_vars.THETA_X)
         self.y_slider.setValue(global_vars.THETA_Y)
         self.z_slider.setValue(global_vars.THETA_Z)
         self.slice_slider.setMaximum(get_curr_image().GetSize()[View.Z.value] - 1)
         self.slice_slider.setValue(global_vars.SLICE)
+        for slider in sliders:
+            slider.blockSignals(False)
         self.x_rotation_label.setText(f"X rotation: {global_vars.THETA_X}°")
         self.y_rotation_label.setText(f"Y rotation: {global_vars.THETA_Y}°")
         self.z_rotation_label.setText(f"Z rotation: {global_vars.THETA_Z}°")
@@ -734,46 +788,66 @@ class MainWindow(QMainWindow):
     def rotate_x(self) -> None:
         """Called when the user updates the x slider.
 
-        Render image and set ``x_rotation_label``.
+        Set ``x_rotation_label`` and schedule a render (see ``RENDER_DEBOUNCE_MS``).
 
         :return: None"""
         x_slider_val: int = self.x_slider.value()
         global_vars.THETA_X = x_slider_val
-        self.render_curr_slice()
         self.x_rotation_label.setText(f"X rotation: {x_slider_val}°")
+        self.render_timer.start()
 
     def rotate_y(self) -> None:
         """Called when the user updates the y slider.
 
-        Render image and set ``y_rotation_label``.
+        Set ``y_rotation_label`` and schedule a render (see ``RENDER_DEBOUNCE_MS``).
 
         :return: None"""
         y_slider_val: int = self.y_slider.value()
         global_vars.THETA_Y = y_slider_val
-        self.render_curr_slice()
         self.y_rotation_label.setText(f"Y rotation: {y_slider_val}°")
+        self.render_timer.start()
 
     def rotate_z(self) -> None:
         """Called when the user updates the z slider.
 
-        Render image and set ``z_rotation_label``.
+        Set ``z_rotation_label`` and schedule a render (see ``RENDER_DEBOUNCE_MS``).
 
         :return: None"""
         z_slider_val: int = self.z_slider.value()
         global_vars.THETA_Z = z_slider_val
-        self.render_curr_slice()
         self.z_rotation_label.setText(f"Z rotation: {z_slider_val}°")
+        self.render_timer.start()
 
     def slice_update(self) -> None:
         """Called when the user updates the slice slider.
 
-        Render image and set ``slice_num_label``.
+        Set ``slice_num_label`` and schedule a render (see ``RENDER_DEBOUNCE_MS``).
 
         :return: None"""
         slice_slider_val: int = self.slice_slider.value()
         global_vars.SLICE = slice_slider_val
-        self.render_curr_slice()
         self.slice_num_label.setText(f"Slice: {slice_slider_val}")
+        self.render_timer.start()
+
+    def slider_pressed(self) -> None:
+        """Called when the user starts dragging a slider.
+
+        Resample with nearest neighbor interpolation at ``DRAG_PREVIEW_SHRINK_FACTOR`` lower resolution
+        while dragging since it's faster and the intermediate slices are only shown briefly.
+
+        :return: None"""
+        global_vars.RESAMPLE_FILTER.SetInterpolator(sitk.sitkNearestNeighbor)
+        global_vars.RESAMPLE_SHRINK_FACTOR = DRAG_PREVIEW_SHRINK_FACTOR
+
+    def slider_released(self) -> None:
+        """Called when the user stops dragging a slider.
+
+        Switch back to full resolution and linear interpolation and render the final slice with it.
+
+        :return: None"""
+        global_vars.RESAMPLE_FILTER.SetInterpolator(sitk.sitkLinear)
+        global_vars.RESAMPLE_SHRINK_FACTOR = 1
+        self.render_curr_slice()
 
     def reset_settings(self) -> None:
         """Called when Reset is clicked.
@@ -792,33 +866,37 @@ class MainWindow(QMainWindow):
     def next_img(self) -> None:
         """Called when Next button is clicked.
 
-        Advance index and render.
+        Advance index and render. Does nothing if there's only one image since the index wouldn't change.
 
         :return: None"""
+        if len(global_vars.IMAGE_DICT) <= 1:
+            return
         img_helpers.next_img()
         # TODO: This feels inefficient...
         self.orient_curr_image()
         binary_contour_or_none: Union[np.ndarray, None] = self.render_curr_slice()
         self.render_image_num_and_path()
 
-        if not SETTINGS_VIEW_ENABLED:
-            # Ignore the type annotation warning. binary_contour_or_none must be binary_contour since not SETTINGS_VIEW_ENABLED
+        if not self.settings_view_enabled:
+            # Ignore the type annotation warning. binary_contour_or_none must be binary_contour since not self.settings_view_enabled
             self.render_circumference(binary_contour_or_none)
 
     def previous_img(self) -> None:
         """Called when Previous button is clicked.
 
-        Decrement index and render.
+        Decrement index and render. Does nothing if there's only one image since the index wouldn't change.
 
         :return: None"""
+        if len(global_vars.IMAGE_DICT) <= 1:
+            return
         img_helpers.previous_img()
         # TODO: This feels inefficient...
         self.orient_curr_image()
         binary_contour_or_none: Union[np.ndarray, None] = self.render_curr_slice()
         self.render_image_num_and_path()
 
-        if not SETTINGS_VIEW_ENABLED:
-            # Ignore the type annotation warning. binary_contour_or_none must be binary_contour since not SETTINGS_VIEW_ENABLED
+        if not self.settings_view_enabled:
+            # Ignore the type annotation warning. binary_contour_or_none must be binary_contour since not self.settings_view_enabled
             self.render_circumference(binary_contour_or_none)
 
     # TODO: Due to the images now being a dict, we can
@@ -839,8 +917,8 @@ class MainWindow(QMainWindow):
         binary_contour_or_none: Union[np.ndarray, None] = self.render_curr_slice()
         self.render_image_num_and_path()
 
-        if not SETTINGS_VIEW_ENABLED:
-            # Ignore the type annotation warning. binary_contour_or_none must be binary_contour since not SETTINGS_VIEW_ENABLED
+        if not self.settings_view_enabled:
+            # Ignore the type annotation warning. binary_contour_or_none must be binary_contour since not self.settings_view_enabled
             self.render_circumference(binary_contour_or_none)
 
     def test_stuff(self) -> None:
@@ -854,17 +932,17 @@ class MainWindow(QMainWindow):
             "This is intentional, if it's a question mark then that's good :), means we can display icons"
         )
 
-    # TODO: File name should also include circumference when not SETTINGS_VIEW_ENABLED?
+    # TODO: File name should also include circumference when not self.settings_view_enabled?
     def export_curr_slice_as_img(self, extension: str) -> None:
         """Called when an Export as image menu item is clicked.
 
-        Exports ``self.image`` to ``constants.OUTPUT_DIR/image_stem/``. Thus, calling this when ``SETTINGS_VIEW_ENABLED`` will
-        save a non-contoured image. Calling this when ``not SETTINGS_VIEW_ENABLED`` will save a contoured
+        Exports ``self.image`` to ``constants.OUTPUT_DIR/image_stem/``. Thus, calling this when ``self.settings_view_enabled`` will
+        save a non-contoured image. Calling this when ``not self.settings_view_enabled`` will save a contoured
         image.
 
         Filename has format <file_name>[_contoured].<extension>
 
-        _contoured will be in the name if ``not SETTINGS_VIEW_ENABLED``.
+        _contoured will be in the name if ``not self.settings_view_enabled``.
 
         Supported formats in this function are the ones supported by QPixmap,
         namely BMP, JPG, JPEG, PNG, PPM, XBM, XPM.
@@ -882,7 +960,7 @@ class MainWindow(QMainWindow):
 
         path: str = str(
             output_path
-            / f"{file_stem}{'_contoured' if not SETTINGS_VIEW_ENABLED else ''}.{extension}"
+            / f"{file_stem}{'_contoured' if not self.settings_view_enabled else ''}.{extension}"
         )
         self.image.pixmap().save(path, extension)
 
@@ -1151,6 +1229,7 @@ def display_spacing() -> None:
 def main() -> None:
     """Main entrypoint of GUI."""
     global_vars.GROUP_MAX_SPACING_DIFF = settings.GROUP_MAX_SPACING_DIFF
+    sitk.ProcessObject.SetGlobalDefaultNumberOfThreads(constants.NUM_ITK_THREADS)
 
     # This import can't go at the top of the file
     # because gui.py.parse_gui_cli() has to set THEME_NAME before the import occurs
@@ -1182,9 +1261,10 @@ def main() -> None:
     # this bug https://github.com/NIRALUser/NeuroRuler/issues/42
     # However, this also seems to affect startup GUI size or at least GUI element spacing
     MAIN_WINDOW.setMinimumSize(QSize(1, 1))
+    monitor_width, monitor_height = constants.primary_monitor_dimensions()
     MAIN_WINDOW.resize(
-        int(settings.STARTUP_WIDTH_RATIO * constants.PRIMARY_MONITOR_DIMENSIONS[0]),
-        int(settings.STARTUP_HEIGHT_RATIO * constants.PRIMARY_MONITOR_DIMENSIONS[1]),
+        int(settings.STARTUP_WIDTH_RATIO * monitor_width),
+        int(settings.STARTUP_HEIGHT_RATIO * monitor_height),
     )
 
     MAIN_WINDOW.show()
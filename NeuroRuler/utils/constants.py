@@ -2,11 +2,11 @@
 
 This file should not import any module in this repo to avoid circular imports."""
 
+import os
 import re
 from pathlib import Path
 import warnings
 import functools
-from screeninfo import get_monitors, ScreenInfoError
 from numpy import pi
 from typing import Union
 from enum import Enum
@@ -53,19 +53,20 @@ if not THEME_DIR.exists():
     except ImportError:
         pass
 
-THEMES: list[str] = []
-"""List of themes, i.e. the names of the directories in THEME_DIR."""
+THEMES: frozenset[str] = frozenset()
+"""Set of themes, i.e. the names of the directories in THEME_DIR."""
 
-# Without this, autodocumentation might crash
+# Single pass over THEME_DIR
+# Without the try, autodocumentation might crash
 # THEME_DIR obviously exists at this point, except maybe in autodocumentation code
-if THEME_DIR.exists():
-    for path in THEME_DIR.iterdir():
-        if path.is_dir():
-            THEMES.append(path.name)
-    THEMES = sorted(THEMES)
-else:
+try:
+    THEMES = frozenset(path.name for path in THEME_DIR.iterdir() if path.is_dir())
+except FileNotFoundError:
     pass
 
+THEMES_HELP_STR: str = ", ".join(sorted(THEMES))
+"""Sorted, comma-separated THEMES for help and error messages."""
+
 
 class View(Enum):
     """X, Y, or Z view.
@@ -91,6 +92,12 @@ class BinaryColor(Enum):
     White = 1
 
 
+NUM_ITK_THREADS: int = max(1, (os.cpu_count() or 1) - 1)
+"""Number of threads used by ITK filters, set in the GUI and CLI main().
+
+ITK's default thread count isn't always a good fit for the machine, so set it explicitly.
+Leave one core for the GUI event loop."""
+
 ROTATION_MIN: int = -90
 """In degrees"""
 ROTATION_MAX: int = 90
@@ -101,19 +108,19 @@ NUM_CONTOURS_IN_INVALID_SLICE: int = 10
 """If this number of contours or more is detected in a slice after processing by contour()
 (Otsu, largest component, etc.), then the slice is considered invalid."""
 
-NIFTI_METADATA_UNITS_VALUE_TO_PHYSICAL_UNITS: dict[str, str] = {
-    "0": "unknown",
-    "1": "meters (m)",
-    "2": "millimeters (mm)",
-    "3": "microns (μm)",
-    "8": "seconds (s)",
-    "16": "milliseconds (ms)",
-    "24": "microseconds (μs)",
-    "32": "Hertz (Hz)",
-    "40": "parts-per-million (ppm)",
-    "48": "radians per second (rad/s)",
+NIFTI_METADATA_UNITS_VALUE_TO_PHYSICAL_UNITS: dict[int, str] = {
+    0: "unknown",
+    1: "meters (m)",
+    2: "millimeters (mm)",
+    3: "microns (μm)",
+    8: "seconds (s)",
+    16: "milliseconds (ms)",
+    24: "microseconds (μs)",
+    32: "Hertz (Hz)",
+    40: "parts-per-million (ppm)",
+    48: "radians per second (rad/s)",
 }
-"""Maps the value of ``xyzt_units`` of the metadata of a NIfTI file to physical meaning.
+"""Maps the value of ``xyzt_units`` of the metadata of a NIfTI file (as an int) to physical meaning.
 
 Based on https://brainder.org/2012/09/23/the-nifti-file-format/.
 
@@ -150,23 +157,43 @@ ORIENTATION_STRINGS: tuple[str, str, str] = (
 
 Intended to be indexed using View.X.value, View.Y.value, and View.Z.value."""
 
-PRIMARY_MONITOR_DIMENSIONS: tuple[int, int] = (500, 500)
-"""Set to user's primary monitor's dimensions. 500, 500 are dummy values"""
+DEFAULT_MONITOR_DIMENSIONS: tuple[int, int] = (500, 500)
+"""Dummy dimensions used if the primary monitor can't be found."""
 
-try:
-    for monitor in get_monitors():
-        if monitor.is_primary:
-            PRIMARY_MONITOR_DIMENSIONS = (monitor.width, monitor.height)
-            break
-except ScreenInfoError:
-    # This will occur in GH automated tests.
-    pass
+
+@functools.lru_cache(maxsize=1)
+def primary_monitor_dimensions() -> tuple[int, int]:
+    """Return the user's primary monitor's dimensions, or DEFAULT_MONITOR_DIMENSIONS if not found.
+
+    Monitors are queried on the first call only (not on import), so the CLI and tests don't pay for it.
+
+    :return: (width, height)
+    :rtype: tuple[int, int]"""
+    from screeninfo import get_monitors, ScreenInfoError
+
+    try:
+        for monitor in get_monitors():
+            if monitor.is_primary:
+                return monitor.width, monitor.height
+    except ScreenInfoError:
+        # This will occur in GH automated tests.
+        pass
+    return DEFAULT_MONITOR_DIMENSIONS
 
 
 MESSAGE_TO_SHOW_IF_UNITS_NOT_FOUND: str = "millimeters (mm)"
 """We assume units are millimeters if we can't find units in metadata"""
 
 
+DEPRECATED_WARNING_PREFIX: str = "Call to deprecated function"
+"""Start of the message of warnings emitted by functions decorated with ``deprecated``."""
+
+# Always show warnings from ``deprecated``. Registered once here instead of changing the filters on every call
+warnings.filterwarnings(
+    "always", message=DEPRECATED_WARNING_PREFIX, category=DeprecationWarning
+)
+
+
 # Source: https://stackoverflow.com/questions/2536307/decorators-in-the-python-standard-lib-deprecated-specifically
 def deprecated(func):
     """This is a decorator which can be used to mark functions
@@ -175,18 +202,20 @@ def deprecated(func):
 
     @functools.wraps(func)
     def new_func(*args, **kwargs):
-        warnings.simplefilter("always", DeprecationWarning)  # turn off filter
         warnings.warn(
-            "Call to deprecated function {}.".format(func.__name__),
+            f"{DEPRECATED_WARNING_PREFIX} {func.__name__}.",
             category=DeprecationWarning,
             stacklevel=2,
         )
-        warnings.simplefilter("default", DeprecationWarning)  # reset filter
         return func(*args, **kwargs)
 
     return new_func
 
 
+PI_OVER_180: float = pi / 180
+"""Multiply degrees by this to get radians."""
+
+
 def degrees_to_radians(angle: Union[int, float]) -> float:
     """It's quite simple.
 
@@ -194,7 +223,7 @@ def degrees_to_radians(angle: Union[int, float]) -> float:
     :type num: int or float
     :return: Equivalent radian measure
     :rtype: float"""
-    return angle * pi / 180
+    return angle * PI_OVER_180
 
 
 def get_path_stem(path: Path) -> str:
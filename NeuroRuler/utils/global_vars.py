@@ -1,7 +1,9 @@
 """Global variables that change throughout program execution."""
 
 import SimpleITK as sitk
+import numpy as np
 from pathlib import Path
+from typing import Optional, Tuple, Union
 from NeuroRuler.utils.constants import View
 
 IMAGE_DICT: dict[Path, sitk.Image] = dict()
@@ -27,9 +29,6 @@ CURR_IMAGE_INDEX: int = 0
 You should probably use the helper functions in img_helpers instead of this (unless you're writing helper
 functions)."""
 
-READER: sitk.ImageFileReader = sitk.ImageFileReader()
-"""Global ``sitk.ImageFileReader``."""
-
 ORIENT_FILTER: sitk.DICOMOrientImageFilter = sitk.DICOMOrientImageFilter()
 """Global ``sitk.DICOMOrientImageFilter`` for orienting images.
 
@@ -44,6 +43,15 @@ Y_CENTER: int = 0
 
 EULER_3D_TRANSFORM: sitk.Euler3DTransform = sitk.Euler3DTransform()
 """Global sitk.Euler3DTransform for 3D rotations."""
+RESAMPLE_FILTER: sitk.ResampleImageFilter = sitk.ResampleImageFilter()
+"""Global sitk.ResampleImageFilter for computing rotated slices.
+
+Reused across renders so that only the output grid and transform are updated per call.
+Uses linear interpolation except while a slider is being dragged in the GUI (nearest neighbor)."""
+RESAMPLE_SHRINK_FACTOR: int = 1
+"""Rotated slices are resampled onto a grid this many times coarser along each in-plane axis.
+
+1 (full resolution) except while a slider is being dragged in the GUI."""
 THETA_X: int = 0
 """In degrees"""
 THETA_Y: int = 0
@@ -53,6 +61,20 @@ THETA_Z: int = 0
 SLICE: int = 0
 """0-indexed"""
 
+ROTATED_SLICE_CACHE: Optional[
+    Tuple[sitk.Image, tuple, sitk.Image, Optional[np.ndarray]]
+] = None
+"""(3D image, settings, 2D rotated slice, uint8 preview array) from the last call to
+``img_helpers.get_curr_rotated_slice``.
+
+settings is the view, rotation, slice, center of rotation, interpolator, and shrink factor used to compute the slice.
+If the current image and settings haven't changed, the slice is reused instead of resampled again.
+
+The preview array is ``img_helpers.slice_to_uint8_array`` of the slice, computed on the first call to
+``img_helpers.get_curr_rotated_slice_uint8`` for these settings (None until then).
+
+Cleared when the current image is removed or replaced, so it doesn't keep that image alive."""
+
 SMOOTHING_FILTER: sitk.GradientAnisotropicDiffusionImageFilter = (
     sitk.GradientAnisotropicDiffusionImageFilter()
 )
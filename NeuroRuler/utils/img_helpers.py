@@ -3,11 +3,15 @@
 Mostly holds helper functions for working with ``IMAGE_DICT`` in ``global_vars.py``."""
 
 from __future__ import annotations
+import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from typing import NamedTuple, Union
 import SimpleITK as sitk
+import numpy as np
 from pathlib import Path
 import NeuroRuler.utils.global_vars as global_vars
-from NeuroRuler.utils.constants import degrees_to_radians, View
+from NeuroRuler.utils.constants import PI_OVER_180, View
 import NeuroRuler.utils.constants as constants
 
 
@@ -39,42 +43,57 @@ def update_images(path_list: list[Path]) -> list[Path]:
     if not path_list:
         raise Exception("update_images assumes path_list isn't empty.")
 
-    # On load, orient the image for Z view by default
-    # If we don't do this, then the misaligned image's GetSize()[2] won't actually be the inferior-superior axis
-    # Then the max slice value would not be correct because it would use some other axis
-    global_vars.ORIENT_FILTER.SetDesiredCoordinateOrientation(
-        constants.Z_ORIENTATION_STR
-    )
+    # Images are read and oriented in parallel. SimpleITK releases the GIL while reading and orienting.
+    # map returns results in the order of path_list, so IMAGE_DICT keeps the order of path_list
+    # All images, including ones that turn out to differ, stay in memory until this returns
+    num_workers: int = min(len(path_list), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        loaded: list[sitk.Image] = list(executor.map(read_axial_image, path_list))
 
     comparison_properties_tuple: ImageProperties
     if global_vars.IMAGE_DICT:
         comparison_properties_tuple = get_curr_properties_tuple()
     else:
         first_path: Path = path_list[0]
+        # Properties of the first image before orienting, from its header
         comparison_properties_tuple = get_properties_from_path(first_path)
-        global_vars.READER.SetFileName(str(first_path))
-        first_img: sitk.Image = global_vars.READER.Execute()
-        first_img_axial: sitk.Image = global_vars.ORIENT_FILTER.Execute(first_img)
-        global_vars.IMAGE_DICT[first_path] = first_img_axial
+        global_vars.IMAGE_DICT[first_path] = loaded[0]
         # Don't need to look at first image again
         path_list = path_list[1:]
+        loaded = loaded[1:]
 
     differing_image_paths: list[Path] = []
 
-    for path in path_list:
-        global_vars.READER.SetFileName(str(path))
-        new_img: sitk.Image = global_vars.READER.Execute()
-        new_img = global_vars.ORIENT_FILTER.Execute(new_img)
-        new_img_properties: ImageProperties = get_properties_from_sitk_image(new_img)
+    for path, new_img_axial in zip(path_list, loaded):
+        new_img_properties: ImageProperties = get_properties_from_sitk_image(
+            new_img_axial
+        )
 
         if not are_properties_eq(comparison_properties_tuple, new_img_properties):
             differing_image_paths.append(path)
         else:
-            new_img_axial: sitk.Image = global_vars.ORIENT_FILTER.Execute(new_img)
             global_vars.IMAGE_DICT[path] = new_img_axial
     return differing_image_paths
 
 
+def read_axial_image(path: Path) -> sitk.Image:
+    """Read the image at path and orient it for the axial (Z) view.
+
+    Doesn't use the shared global_vars.ORIENT_FILTER, so it's safe to call from multiple threads.
+
+    On load, orient the image for Z view by default.
+    If we don't do this, then the misaligned image's GetSize()[2] won't actually be the inferior-superior axis.
+    Then the max slice value would not be correct because it would use some other axis.
+
+    :param path:
+    :type path: Path
+    :return: oriented image
+    :rtype: sitk.Image"""
+    return sitk.DICOMOrient(
+        sitk.ReadImage(os.fspath(path)), constants.Z_ORIENTATION_STR
+    )
+
+
 def initialize_globals(path_list: list[Path]) -> list[Path]:
     """After pressing File > Open, the global variables need to be cleared and (re)initialized.
 
@@ -82,7 +101,7 @@ def initialize_globals(path_list: list[Path]) -> list[Path]:
     False, and IMAGE_DICT isn't updated with the differing images.
 
     Mutated global variables: IMAGE_DICT, CURR_IMAGE_INDEX,
-    READER, THETA_X, THETA_Y, THETA_Z, SLICE, EULER_3D_TRANSFORM.
+    THETA_X, THETA_Y, THETA_Z, SLICE, EULER_3D_TRANSFORM, ROTATED_SLICE_CACHE.
 
     Specifically, clears IMAGE_DICT and then populates it.
 
@@ -92,6 +111,7 @@ def initialize_globals(path_list: list[Path]) -> list[Path]:
     :rtype: list[Path]"""
     global_vars.CURR_IMAGE_INDEX = 0
     global_vars.IMAGE_DICT.clear()
+    global_vars.ROTATED_SLICE_CACHE = None
     differing_image_paths: list[Path] = update_images(path_list)
     global_vars.THETA_X = 0
     global_vars.THETA_Y = 0
@@ -127,6 +147,7 @@ def clear_globals() -> None:
     global_vars.THETA_Y = 0
     global_vars.THETA_Z = 0
     global_vars.SLICE = 0
+    global_vars.ROTATED_SLICE_CACHE = None
 
 
 def image_dict_is_empty() -> bool:
@@ -139,9 +160,20 @@ def image_dict_is_empty() -> bool:
 def get_curr_path() -> Path:
     """Return the current Path in IMAGE_DICT. That is, the key at index CURR_IMAGE_INDEX.
 
+    :raise: IndexError if CURR_IMAGE_INDEX is out of range (e.g., IMAGE_DICT is empty)
     :return: Path of current image
     :rtype: Path"""
-    return list(global_vars.IMAGE_DICT.keys())[global_vars.CURR_IMAGE_INDEX]
+    # Avoids building a list of all keys just to index into it.
+    # Negative indices and IndexError behave like indexing that list
+    index: int = global_vars.CURR_IMAGE_INDEX
+    if index < 0:
+        index += len(global_vars.IMAGE_DICT)
+    path: Union[Path, None] = (
+        next(islice(global_vars.IMAGE_DICT, index, None), None) if index >= 0 else None
+    )
+    if path is None:
+        raise IndexError("CURR_IMAGE_INDEX out of range of IMAGE_DICT")
+    return path
 
 
 def get_all_paths() -> list[Path]:
@@ -201,15 +233,33 @@ def are_properties_eq(props1: ImageProperties, props2: ImageProperties) -> bool:
 
 
 def get_properties_from_path(path: Path) -> ImageProperties:
-    """Tuple of properties of the sitk.Image we get from path. Uses global_vars.READER.
+    """Tuple of properties of the sitk.Image we get from path.
+
+    Only reads the image's header (``ReadImageInformation``), not its pixel data.
+    The result is the same as ``get_properties_from_sitk_image`` of the full image.
 
     :param path: Path from which we can get a sitk.Image
     :type path: Path
     :return: (dimensions, center of rotation used in EULER_3D_TRANSFORM, spacing)
     :rtype: ImageProperties"""
-    global_vars.READER.SetFileName(str(path))
-    img: sitk.Image = global_vars.READER.Execute()
-    return get_properties_from_sitk_image(img)
+    # A new reader per call. Reusing one reader across files can slow down, and it isn't thread-safe
+    reader: sitk.ImageFileReader = sitk.ImageFileReader()
+    reader.SetFileName(os.fspath(path))
+    reader.ReadImageInformation()
+    size: tuple[int, int, int] = reader.GetSize()
+    # Image with the same physical space but no real pixel data,
+    # just to compute the center the same way as get_center_of_rotation
+    geometry: sitk.Image = sitk.Image([1] * len(size), sitk.sitkUInt8)
+    geometry.SetOrigin(reader.GetOrigin())
+    geometry.SetSpacing(reader.GetSpacing())
+    geometry.SetDirection(reader.GetDirection())
+    return ImageProperties(
+        geometry.TransformContinuousIndexToPhysicalPoint(
+            [(dimension - 1) / 2.0 for dimension in size]
+        ),
+        size,
+        reader.GetSpacing(),
+    )
 
 
 def get_middle_dimension(img: sitk.Image, axis: View) -> int:
@@ -270,6 +320,8 @@ def orient_curr_image(view: View) -> None:
     )
     oriented: sitk.Image = global_vars.ORIENT_FILTER.Execute(get_curr_image())
     set_curr_image(oriented)
+    # The cached slice is of the image that was just replaced
+    global_vars.ROTATED_SLICE_CACHE = None
 
 
 def get_curr_rotated_slice() -> sitk.Image:
@@ -278,36 +330,189 @@ def get_curr_rotated_slice() -> sitk.Image:
     Sets global_vars.EULER_3D_TRANSFORM's rotation values but not its center since all loaded images should
     have the same center.
 
+    If global_vars.RESAMPLE_SHRINK_FACTOR > 1, the slice is downsampled by that factor (see ``resample_slice``).
+
+    The result is cached in global_vars.ROTATED_SLICE_CACHE. If the current image, view, rotation, slice,
+    center of rotation, interpolator, and shrink factor are unchanged since the last call, the cached slice is returned without resampling.
+    Don't mutate the returned slice.
+
     :return: 2D rotated slice
     :rtype: sitk.Image"""
-    global_vars.EULER_3D_TRANSFORM.SetRotation(
-        degrees_to_radians(global_vars.THETA_X),
-        degrees_to_radians(global_vars.THETA_Y),
-        degrees_to_radians(global_vars.THETA_Z),
+    curr_img: sitk.Image = get_curr_image()
+    settings: tuple = (
+        global_vars.VIEW,
+        global_vars.THETA_X,
+        global_vars.THETA_Y,
+        global_vars.THETA_Z,
+        global_vars.SLICE,
+        global_vars.X_CENTER,
+        global_vars.Y_CENTER,
+        global_vars.EULER_3D_TRANSFORM.GetCenter(),
+        global_vars.RESAMPLE_FILTER.GetInterpolator(),
+        global_vars.RESAMPLE_SHRINK_FACTOR,
     )
-    rotated_image: sitk.Image = sitk.Resample(
-        get_curr_image(), global_vars.EULER_3D_TRANSFORM
+    cached = global_vars.ROTATED_SLICE_CACHE
+    # Compare images with `is`. sitk.Image's == is pixel-wise and returns an image
+    if cached is not None and cached[0] is curr_img and cached[1] == settings:
+        return cached[2]
+
+    set_rotation_in_degrees(
+        global_vars.EULER_3D_TRANSFORM,
+        global_vars.THETA_X,
+        global_vars.THETA_Y,
+        global_vars.THETA_Z,
     )
-    rotated_slice: sitk.Image
+    slice_index: int
     if global_vars.VIEW == constants.View.X:
-        rotated_slice = rotated_image[global_vars.X_CENTER, :, :]
+        slice_index = global_vars.X_CENTER
     elif global_vars.VIEW == constants.View.Y:
-        rotated_slice = rotated_image[:, global_vars.Y_CENTER, :]
+        slice_index = global_vars.Y_CENTER
     else:
-        rotated_slice = rotated_image[:, :, global_vars.SLICE]
+        slice_index = global_vars.SLICE
+    rotated_slice: sitk.Image = resample_slice(
+        curr_img,
+        global_vars.EULER_3D_TRANSFORM,
+        global_vars.VIEW,
+        slice_index,
+        global_vars.RESAMPLE_SHRINK_FACTOR,
+    )
 
+    global_vars.ROTATED_SLICE_CACHE = (curr_img, settings, rotated_slice, None)
     return rotated_slice
 
 
+def get_curr_rotated_slice_uint8() -> np.ndarray:
+    """Return ``slice_to_uint8_array(get_curr_rotated_slice())``, the array the GUI displays.
+
+    Cached in global_vars.ROTATED_SLICE_CACHE along with the slice, so rendering the same slice again
+    (e.g., previewing settings, then pressing Apply) doesn't normalize it again.
+    Don't mutate the returned array.
+
+    :return: 0..255 normalized uint8 array, shape (height, width)
+    :rtype: np.ndarray"""
+    rotated_slice: sitk.Image = get_curr_rotated_slice()
+    cached = global_vars.ROTATED_SLICE_CACHE
+    # get_curr_rotated_slice always fills the cache
+    assert cached is not None
+    slice_uint8: Union[np.ndarray, None] = cached[3]
+    if slice_uint8 is None:
+        slice_uint8 = slice_to_uint8_array(rotated_slice)
+        global_vars.ROTATED_SLICE_CACHE = (cached[0], cached[1], cached[2], slice_uint8)
+    return slice_uint8
+
+
+def slice_to_uint8_array(sitk_slice: sitk.Image) -> np.ndarray:
+    """Normalize a 2D sitk.Image slice to a 0..255 uint8 array (min to 0, max to 255).
+
+    The result is the transpose of the sitk representation, like ``sitk.GetArrayFromImage``.
+    The slice is read through ``sitk.GetArrayViewFromImage``, so it isn't copied before normalizing,
+    and the normalization is done in float32.
+
+    :param sitk_slice: 2D slice
+    :type sitk_slice: sitk.Image
+    :return: 0..255 normalized uint8 array, shape (height, width)
+    :rtype: np.ndarray"""
+    slice_np: np.ndarray = sitk.GetArrayViewFromImage(sitk_slice)
+    min_value: float = float(slice_np.min())
+    max_value: float = float(slice_np.max())
+    normalized: np.ndarray = np.subtract(slice_np, min_value, dtype=np.float32)
+    if max_value != min_value:
+        normalized *= 255.0 / (max_value - min_value)
+    return normalized.astype(np.uint8)
+
+
+def set_rotation_in_degrees(
+    transform: sitk.Euler3DTransform,
+    theta_x: Union[int, float],
+    theta_y: Union[int, float],
+    theta_z: Union[int, float],
+) -> None:
+    """Set the rotation of transform from x, y, and z angles in degrees.
+
+    :param transform:
+    :type transform: sitk.Euler3DTransform
+    :param theta_x: In degrees
+    :type theta_x: int or float
+    :param theta_y: In degrees
+    :type theta_y: int or float
+    :param theta_z: In degrees
+    :type theta_z: int or float
+    :return: None"""
+    transform.SetRotation(
+        theta_x * PI_OVER_180, theta_y * PI_OVER_180, theta_z * PI_OVER_180
+    )
+
+
+def resample_slice(
+    img: sitk.Image,
+    transform: sitk.Transform,
+    view: View,
+    slice_index: int,
+    shrink_factor: int = 1,
+) -> sitk.Image:
+    """Return the 2D slice at ``slice_index`` along the ``view`` axis of ``sitk.Resample(img, transform)``
+    without resampling the rest of the volume.
+
+    The output grid is just the plane of ``img`` containing the slice (same origin, spacing, and direction
+    as ``img`` but size 1 along the ``view`` axis), so only the pixels of the slice are interpolated.
+    For example, for View.Z, the result is ``sitk.Resample(img, transform)[:, :, slice_index]`` up to
+    interpolation rounding: the sample positions can differ in the last bits, so integer pixel types
+    can differ by 1 on some pixels (seen for View.X even with no rotation).
+
+    If ``shrink_factor > 1``, the plane is sampled every ``shrink_factor`` pixels along its two in-plane axes
+    (size divided and spacing multiplied by ``shrink_factor``), which is cheaper for previews.
+    Pixel (i, j) of the result then corresponds to pixel (i * shrink_factor, j * shrink_factor) of the
+    full resolution slice.
+
+    Uses ``global_vars.RESAMPLE_FILTER`` (and its interpolator) instead of constructing a new filter per call.
+
+    :param img: 3D image
+    :type img: sitk.Image
+    :param transform:
+    :type transform: sitk.Transform
+    :param view: Axis along which to take the slice
+    :type view: View
+    :param slice_index: 0-indexed
+    :type slice_index: int
+    :param shrink_factor: Downsampling factor of the slice. Defaults to 1 (full resolution)
+    :type shrink_factor: int
+    :return: 2D rotated slice
+    :rtype: sitk.Image"""
+    # Ceiling division so the last row/column of the full resolution plane is still covered
+    plane_size: list[int] = [-(-size // shrink_factor) for size in img.GetSize()]
+    plane_size[view.value] = 1
+    plane_spacing: list[float] = [
+        spacing * shrink_factor for spacing in img.GetSpacing()
+    ]
+    plane_spacing[view.value] = img.GetSpacing()[view.value]
+    plane_start: list[int] = [0, 0, 0]
+    plane_start[view.value] = slice_index
+    resampler: sitk.ResampleImageFilter = global_vars.RESAMPLE_FILTER
+    resampler.SetSize(plane_size)
+    resampler.SetOutputOrigin(img.TransformIndexToPhysicalPoint(plane_start))
+    resampler.SetOutputSpacing(plane_spacing)
+    resampler.SetOutputDirection(img.GetDirection())
+    resampler.SetTransform(transform)
+    rotated_plane: sitk.Image = resampler.Execute(img)
+    if view == View.X:
+        return rotated_plane[0, :, :]
+    elif view == View.Y:
+        return rotated_plane[:, 0, :]
+    return rotated_plane[:, :, 0]
+
+
 def get_curr_smooth_slice() -> sitk.Image:
     """Return smoothed 2D rotated slice of the current image determined by global smoothing settings.
 
+    Only for previewing smoothing in the GUI, so it smooths in float32, which is half the memory of float64
+    and looks the same. ``imgproc.contour()`` still smooths in float64 for computing circumference.
+
     :return: smooth 2D rotated slice
     :rtype: sitk.Image"""
     rotated_slice: sitk.Image = get_curr_rotated_slice()
     # The cast is necessary, otherwise get sitk::ERROR: Pixel type: 16-bit signed integer is not supported in 2D
     smooth_slice: sitk.Image = global_vars.SMOOTHING_FILTER.Execute(
-        sitk.Cast(rotated_slice, sitk.sitkFloat64)
+        sitk.Cast(rotated_slice, sitk.sitkFloat32)
     )
     return smooth_slice
 
@@ -362,9 +567,9 @@ def get_curr_physical_units() -> Union[str, None]:
     :return: units or None
     :rtype: str or None"""
     curr_img: sitk.Image = get_curr_image()
-    if constants.NIFTI_METADATA_UNITS_KEY in curr_img.GetMetaDataKeys():
+    if curr_img.HasMetaDataKey(constants.NIFTI_METADATA_UNITS_KEY):
         return constants.NIFTI_METADATA_UNITS_VALUE_TO_PHYSICAL_UNITS[
-            curr_img.GetMetaData(constants.NIFTI_METADATA_UNITS_KEY)
+            int(curr_img.GetMetaData(constants.NIFTI_METADATA_UNITS_KEY))
         ]
     return None
 
@@ -374,7 +579,7 @@ def get_curr_properties_tuple() -> ImageProperties:
 
     :return: current properties tuple
     :rtype: ImageProperties"""
-    return get_properties_from_sitk_image(list(global_vars.IMAGE_DICT.values())[0])
+    return get_properties_from_sitk_image(next(iter(global_vars.IMAGE_DICT.values())))
 
 
 def del_curr_img() -> None:
@@ -385,6 +590,8 @@ def del_curr_img() -> None:
     Will not check for IMAGE_DICT being empty after the deletion (GUI should be disabled).
     This happens in the GUI.
 
+    Clears ROTATED_SLICE_CACHE so that it doesn't keep the removed image alive.
+
     :return: None
     :rtype: None"""
     if len(global_vars.IMAGE_DICT) == 0:
@@ -392,6 +599,7 @@ def del_curr_img() -> None:
         return
 
     del global_vars.IMAGE_DICT[get_curr_path()]
+    global_vars.ROTATED_SLICE_CACHE = None
 
     # Just deleted the last image. Index must decrease by 1
     if global_vars.CURR_IMAGE_INDEX == len(global_vars.IMAGE_DICT):
@@ -399,23 +607,25 @@ def del_curr_img() -> None:
 
 
 def next_img() -> None:
-    """Increment CURR_IMAGE_INDEX, wrapping if necessary.
+    """Increment CURR_IMAGE_INDEX, wrapping if necessary. Does nothing if IMAGE_DICT is empty.
 
     :return: None
     :rtype: None"""
-    global_vars.CURR_IMAGE_INDEX = (global_vars.CURR_IMAGE_INDEX + 1) % len(
-        global_vars.IMAGE_DICT
-    )
+    num_images: int = len(global_vars.IMAGE_DICT)
+    if num_images == 0:
+        return
+    global_vars.CURR_IMAGE_INDEX = (global_vars.CURR_IMAGE_INDEX + 1) % num_images
 
 
 def previous_img() -> None:
-    """Decrement CURR_IMAGE_INDEX, wrapping if necessary.
+    """Decrement CURR_IMAGE_INDEX, wrapping if necessary. Does nothing if IMAGE_DICT is empty.
 
     :return: None
     :rtype: None"""
-    global_vars.CURR_IMAGE_INDEX = (global_vars.CURR_IMAGE_INDEX - 1) % len(
-        global_vars.IMAGE_DICT
-    )
+    num_images: int = len(global_vars.IMAGE_DICT)
+    if num_images == 0:
+        return
+    global_vars.CURR_IMAGE_INDEX = (global_vars.CURR_IMAGE_INDEX - 1) % num_images
 
 
 def get_rotated_slice_hardcoded(
@@ -427,7 +637,8 @@ def get_rotated_slice_hardcoded(
 ) -> sitk.Image:
     """Get 2D rotated slice of mri_img_3d from hardcoded values. Rotation values are in degrees, slice_num is an int.
 
-    For unit testing. Sets center of global EULER_3D_TRANSFORM to center of rotation of mri_img_3d.
+    For unit testing. Uses its own sitk.Euler3DTransform centered at the center of rotation of mri_img_3d,
+    so global_vars.EULER_3D_TRANSFORM (and the GUI's rotated slice cache) isn't affected.
 
     :param mri_img_3d:
     :type mri_img_3d: sitk.Image
@@ -441,10 +652,7 @@ def get_rotated_slice_hardcoded(
     :type slice_num: int
     :return: 2D rotated slice using hardcoded settings
     :rtype: sitk.Image"""
-    global_vars.EULER_3D_TRANSFORM.SetCenter(get_center_of_rotation(mri_img_3d))
-    global_vars.EULER_3D_TRANSFORM.SetRotation(
-        degrees_to_radians(theta_x),
-        degrees_to_radians(theta_y),
-        degrees_to_radians(theta_z),
-    )
-    return sitk.Resample(mri_img_3d, global_vars.EULER_3D_TRANSFORM)[:, :, slice_num]
+    euler_3d_transform: sitk.Euler3DTransform = sitk.Euler3DTransform()
+    euler_3d_transform.SetCenter(get_center_of_rotation(mri_img_3d))
+    set_rotation_in_degrees(euler_3d_transform, theta_x, theta_y, theta_z)
+    return resample_slice(mri_img_3d, euler_3d_transform, View.Z, slice_num)
@@ -187,18 +187,29 @@ def length_of_contour_with_spacing(
 
     parent_contour: np.ndarray = contours[0]
 
-    arc_length: float = 0
-
-    for i in range(len(parent_contour) - 1):
-        # contours[0] would return [[x y]], so need to do an additional [0] index to just get [x y]
-        arc_length += distance_2d_with_spacing(
-            parent_contour[i][0], parent_contour[i + 1][0], x_spacing, y_spacing
-        )
-    # Get distance between first and last points
-    arc_length += distance_2d_with_spacing(
-        parent_contour[-1][0], parent_contour[0][0], x_spacing, y_spacing
+    # contours[0] is shape (N, 1, 2), i.e. [[[x y]] [[x y]] ...]. Flatten to (N, 2)
+    points: np.ndarray = np.ascontiguousarray(
+        parent_contour.reshape(-1, 2), dtype=np.float64
     )
-    return arc_length
+    return closed_arc_length_with_spacing(points, x_spacing, y_spacing)
+
+
+def closed_arc_length_with_spacing(
+    points: np.ndarray, x_spacing: float, y_spacing: float
+) -> float:
+    r"""Return the arc length of the closed curve through ``points`` given x and y spacing values.
+
+    :param points: (N, 2) float64 array of [x y] points
+    :type points: np.ndarray
+    :param x_spacing:
+    :type x_spacing: float
+    :param y_spacing:
+    :type y_spacing: float
+    :return: arc length, including the distance between the last and first points
+    :rtype: float"""
+    # Appending the first point gets the distance between the last and first points
+    diffs: np.ndarray = np.diff(points, axis=0, append=points[:1])
+    return float(np.hypot(x_spacing * diffs[:, 0], y_spacing * diffs[:, 1]).sum())
 
 
 def distance_2d_with_spacing(p1, p2, x_spacing: float, y_spacing: float) -> float:
@@ -4,17 +4,21 @@
 # and we should just keep the general parse functions here
 # Agree - Jesse
 
-import argparse
 import json
 from pathlib import Path
 import string
-from typing import Union
+import sys
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Dict, List, Union
 
 import NeuroRuler.utils.cli_settings as cli_settings
 import NeuroRuler.utils.gui_settings as gui_settings
 import NeuroRuler.utils.constants as constants
 import NeuroRuler.utils.exceptions as exceptions
 
+if TYPE_CHECKING:
+    import argparse
+
 JSON_SETTINGS: dict = dict()
 """Dict of settings resulting from JSON file parsing. Global within this file."""
 
@@ -23,6 +27,9 @@ def parse_cli() -> None:
     """Parse CLI (non-GUI) args and set settings in ``cli_settings.py``.
 
     :return: None"""
+    # Imported here since the GUI usually doesn't need argparse (see parse_gui_cli)
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="A program that calculates head circumference from MRI data (``.nii``, ``.nii.gz``, ``.nrrd``).",
     )
@@ -123,23 +130,79 @@ def parse_cli() -> None:
     cli_settings.FILE = args.file
 
 
-def parse_gui_cli() -> None:
-    """Parse GUI CLI args and set settings in ``gui_settings.py``.
+GUI_CLI_OPTIONS: Dict[str, str] = {
+    "-d": "debug",
+    "--debug": "debug",
+    "-t": "theme",
+    "--theme": "theme",
+    "-c": "color",
+    "--color": "color",
+}
+"""Maps each GUI CLI option to its destination in the namespace returned by ``scan_gui_cli``."""
+
+
+def scan_gui_cli(argv: List[str]) -> Union[SimpleNamespace, None]:
+    """Scan GUI CLI args of the simple forms ``-d``, ``-t THEME``, and ``-c COLOR`` (or their long forms)
+    without argparse.
+
+    Returns None for anything else (e.g., ``-h``, ``--theme=dark``, unknown or incomplete options),
+    in which case ``parse_gui_cli`` falls back to argparse for parsing, help, and error messages.
+
+    :param argv: Args without the program name, i.e. ``sys.argv[1:]``
+    :type argv: list[str]
+    :return: Namespace with the same attributes argparse would set, or None
+    :rtype: SimpleNamespace or None"""
+    args: SimpleNamespace = SimpleNamespace(debug=False, theme=None, color=None)
+    i: int = 0
+    while i < len(argv):
+        dest: Union[str, None] = GUI_CLI_OPTIONS.get(argv[i])
+        if dest is None:
+            return None
+        if dest == "debug":
+            args.debug = True
+            i += 1
+            continue
+        if i + 1 == len(argv) or argv[i + 1].startswith("-"):
+            return None
+        setattr(args, dest, argv[i + 1])
+        i += 2
+    return args
+
+
+def gui_cli_argparser() -> "argparse.ArgumentParser":
+    """Return the argparse parser for GUI CLI args.
+
+    Used by ``parse_gui_cli`` when ``scan_gui_cli`` can't handle the args. Imports argparse.
+
+    :return: parser
+    :rtype: argparse.ArgumentParser"""
+    import argparse
 
-    :return: None"""
     parser = argparse.ArgumentParser()
     parser.add_argument("-d", "--debug", help="print debug info", action="store_true")
     parser.add_argument(
         "-t",
         "--theme",
-        help="configure theme, options are " + iterable_of_str_to_str(constants.THEMES),
+        help="configure theme, options are " + constants.THEMES_HELP_STR,
     )
     parser.add_argument(
         "-c",
         "--color",
         help="contour color as name (e.g. red) or hex color code rrggbb",
     )
-    args = parser.parse_args()
+    return parser
+
+
+def parse_gui_cli() -> None:
+    """Parse GUI CLI args and set settings in ``gui_settings.py``.
+
+    The usual args are scanned by ``scan_gui_cli``. argparse is imported and used only if that fails.
+
+    :return: None"""
+    scanned_args: Union[SimpleNamespace, None] = scan_gui_cli(sys.argv[1:])
+    args: Union[SimpleNamespace, argparse.Namespace] = (
+        scanned_args if scanned_args is not None else gui_cli_argparser().parse_args()
+    )
 
     if args.debug:
         gui_settings.DEBUG = True
@@ -147,9 +210,7 @@ def parse_gui_cli() -> None:
 
     if args.theme is not None:
         if args.theme not in constants.THEMES:
-            print(
-                f"Invalid theme specified. Options are {iterable_of_str_to_str(constants.THEMES)}"
-            )
+            print(f"Invalid theme specified. Options are {constants.THEMES_HELP_STR}")
             exit(1)
 
         gui_settings.THEME_NAME = args.theme
@@ -219,9 +280,7 @@ def parse_gui_config() -> None:
     gui_settings.FILE_BROWSER_START_DIR = parse_path("FILE_BROWSER_START_DIR")
     gui_settings.THEME_NAME = JSON_SETTINGS["THEME_NAME"]
     if gui_settings.THEME_NAME not in constants.THEMES:
-        raise exceptions.InvalidJSONField(
-            "THEME_NAME", iterable_of_str_to_str(constants.THEMES)
-        )
+        raise exceptions.InvalidJSONField("THEME_NAME", constants.THEMES_HELP_STR)
 
     contour_color: str = JSON_SETTINGS["CONTOUR_COLOR"]
     if contour_color == "":
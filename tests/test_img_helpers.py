@@ -1,3 +1,5 @@
+import pytest
+from concurrent.futures import ThreadPoolExecutor
 from NeuroRuler.utils.img_helpers import *
 import NeuroRuler.utils.global_vars as global_vars
 
@@ -13,11 +15,11 @@ IMAGE_NAMES: list[str] = [
 
 IMAGE_PATHS: list[Path] = [constants.DATA_DIR / path_str for path_str in IMAGE_NAMES]
 
-IMAGE_DICT: dict[Path, sitk.Image] = dict()
-
-for path in IMAGE_PATHS:
-    global_vars.READER.SetFileName(str(path))
-    IMAGE_DICT[path] = global_vars.READER.Execute()
+# The files are independent, and SimpleITK releases the GIL while reading, so read them in parallel
+with ThreadPoolExecutor() as executor:
+    IMAGE_DICT: dict[Path, sitk.Image] = dict(
+        zip(IMAGE_PATHS, executor.map(sitk.ReadImage, map(str, IMAGE_PATHS)))
+    )
 
 GROUP_1: list[sitk.Image] = [IMAGE_DICT[k] for k in IMAGE_PATHS[:5]]
 GROUP_2: list[sitk.Image] = [IMAGE_DICT[IMAGE_PATHS[5]]]
@@ -57,9 +59,209 @@ def test_curr_path():
     assert get_curr_path() == IMAGE_PATHS[2]
 
 
+def test_curr_path_out_of_range_raises_index_error():
+    clear_globals()
+    with pytest.raises(IndexError):
+        get_curr_path()
+    initialize_globals(IMAGE_PATHS)
+    global_vars.CURR_IMAGE_INDEX = len(global_vars.IMAGE_DICT)
+    with pytest.raises(IndexError):
+        get_curr_path()
+    # Like indexing a list of the keys
+    global_vars.CURR_IMAGE_INDEX = -1
+    assert get_curr_path() == list(global_vars.IMAGE_DICT)[-1]
+
+
 def test_del_curr_img_delete_last():
     clear_globals()
     initialize_globals(IMAGE_PATHS)
     global_vars.CURR_IMAGE_INDEX = len(global_vars.IMAGE_DICT) - 1
     del_curr_img()
     assert global_vars.CURR_IMAGE_INDEX == len(global_vars.IMAGE_DICT) - 1
+
+
+def test_resample_slice_same_as_slice_of_resampled_volume():
+    """resample_slice for each View is the same as slicing ``sitk.Resample`` of the whole volume,
+    and for View.Z the same as get_rotated_slice_hardcoded."""
+    # Float so that tiny differences in the interpolated positions can't round to a different int
+    img: sitk.Image = sitk.Cast(GROUP_1[0], sitk.sitkFloat32)
+    transform: sitk.Euler3DTransform = sitk.Euler3DTransform()
+    transform.SetCenter(get_center_of_rotation(img))
+    set_rotation_in_degrees(transform, 15, 10, 5)
+    rotated_img: sitk.Image = sitk.Resample(img, transform)
+    x, y, z = (size // 3 for size in img.GetSize())
+    expected_slices: dict[View, sitk.Image] = {
+        View.X: rotated_img[x, :, :],
+        View.Y: rotated_img[:, y, :],
+        View.Z: rotated_img[:, :, z],
+    }
+    for view, slice_index in zip((View.X, View.Y, View.Z), (x, y, z)):
+        rotated_slice: sitk.Image = resample_slice(img, transform, view, slice_index)
+        assert rotated_slice.GetSize() == expected_slices[view].GetSize()
+        assert np.allclose(
+            sitk.GetArrayViewFromImage(rotated_slice),
+            sitk.GetArrayViewFromImage(expected_slices[view]),
+            atol=0.001,
+        )
+    assert np.allclose(
+        sitk.GetArrayViewFromImage(resample_slice(img, transform, View.Z, z)),
+        sitk.GetArrayViewFromImage(get_rotated_slice_hardcoded(img, 15, 10, 5, z)),
+        atol=0.001,
+    )
+
+
+def test_resample_slice_of_int_image_within_1_of_slice_of_resampled_volume():
+    """For integer pixel types, resample_slice can differ by 1 from slicing ``sitk.Resample`` of the
+    whole volume, even with no rotation, because the interpolated positions differ in the last bits
+    and the result is rounded. Never by more than 1."""
+    img: sitk.Image = GROUP_1[0]
+    transform: sitk.Euler3DTransform = sitk.Euler3DTransform()
+    transform.SetCenter(get_center_of_rotation(img))
+    rotated_img: sitk.Image = sitk.Resample(img, transform)
+    for view in (View.X, View.Y, View.Z):
+        for slice_index in range(img.GetSize()[view.value]):
+            plane: list = [slice(None)] * 3
+            plane[view.value] = slice_index
+            assert np.allclose(
+                sitk.GetArrayViewFromImage(
+                    resample_slice(img, transform, view, slice_index)
+                ),
+                sitk.GetArrayViewFromImage(rotated_img[tuple(plane)]),
+                rtol=0,
+                atol=1,
+            )
+
+
+def test_resample_slice_shrink_factor_2_halves_size_doubles_spacing():
+    img: sitk.Image = GROUP_1[0]
+    transform: sitk.Euler3DTransform = sitk.Euler3DTransform()
+    transform.SetCenter(get_center_of_rotation(img))
+    size: tuple = img.GetSize()
+    spacing: tuple = img.GetSpacing()
+    for view in (View.X, View.Y, View.Z):
+        full: sitk.Image = resample_slice(img, transform, view, size[view.value] // 2)
+        shrunk: sitk.Image = resample_slice(
+            img, transform, view, size[view.value] // 2, shrink_factor=2
+        )
+        in_plane_axes: list[int] = [axis for axis in range(3) if axis != view.value]
+        # Ceiling division, so odd sizes still cover the last row/column
+        assert shrunk.GetSize() == tuple(-(-size[axis] // 2) for axis in in_plane_axes)
+        assert shrunk.GetSpacing() == tuple(2 * spacing[axis] for axis in in_plane_axes)
+        # Pixel (i, j) of the shrunk slice is pixel (2i, 2j) of the full slice
+        assert np.array_equal(
+            sitk.GetArrayViewFromImage(shrunk),
+            sitk.GetArrayViewFromImage(full)[::2, ::2],
+        )
+
+
+def test_resample_slice_keeps_resample_filter_interpolator():
+    """The GUI switches RESAMPLE_FILTER to nearest neighbor while dragging a slider and back to
+    linear on release. resample_slice must use whichever is set and leave it set."""
+    img: sitk.Image = sitk.Cast(GROUP_1[0], sitk.sitkFloat32)
+    transform: sitk.Euler3DTransform = sitk.Euler3DTransform()
+    transform.SetCenter(get_center_of_rotation(img))
+    set_rotation_in_degrees(transform, 15, 10, 5)
+    slice_index: int = img.GetSize()[2] // 2
+    try:
+        for interpolator in (sitk.sitkNearestNeighbor, sitk.sitkLinear):
+            global_vars.RESAMPLE_FILTER.SetInterpolator(interpolator)
+            rotated_slice: sitk.Image = resample_slice(
+                img, transform, View.Z, slice_index
+            )
+            assert global_vars.RESAMPLE_FILTER.GetInterpolator() == interpolator
+            expected: sitk.Image = sitk.Resample(img, transform, interpolator)[
+                :, :, slice_index
+            ]
+            assert np.allclose(
+                sitk.GetArrayViewFromImage(rotated_slice),
+                sitk.GetArrayViewFromImage(expected),
+                atol=0.001,
+            )
+    finally:
+        global_vars.RESAMPLE_FILTER.SetInterpolator(sitk.sitkLinear)
+
+
+def test_properties_from_header_same_as_from_full_read():
+    """get_properties_from_path reads only the header. Its properties, and the header's origin,
+    direction, and physical units, are the same as those of the fully read image."""
+    for path, img in IMAGE_DICT.items():
+        assert get_properties_from_path(path) == get_properties_from_sitk_image(img)
+
+        reader: sitk.ImageFileReader = sitk.ImageFileReader()
+        reader.SetFileName(str(path))
+        reader.ReadImageInformation()
+        assert reader.GetSize() == img.GetSize()
+        assert reader.GetSpacing() == img.GetSpacing()
+        assert reader.GetOrigin() == img.GetOrigin()
+        assert reader.GetDirection() == img.GetDirection()
+        units_key: str = constants.NIFTI_METADATA_UNITS_KEY
+        assert reader.HasMetaDataKey(units_key) == img.HasMetaDataKey(units_key)
+        if img.HasMetaDataKey(units_key):
+            assert reader.GetMetaData(units_key) == img.GetMetaData(units_key)
+
+
+def rotated_slice_cache_missed(change) -> bool:
+    """Return True if get_curr_rotated_slice resamples again after calling change().
+
+    A cache hit returns the cached slice object itself.
+
+    :param change: Function that changes global state
+    :type change: Callable[[], Any]
+    :return: True if the call after change() didn't return the cached slice
+    :rtype: bool"""
+    before: sitk.Image = get_curr_rotated_slice()
+    change()
+    return get_curr_rotated_slice() is not before
+
+
+def test_rotated_slice_cache_hit_when_nothing_changes():
+    clear_globals()
+    initialize_globals(IMAGE_PATHS)
+    assert not rotated_slice_cache_missed(lambda: None)
+
+
+def test_rotated_slice_cache_miss_on_theta_or_slice_change():
+    clear_globals()
+    initialize_globals(IMAGE_PATHS)
+    for name in ("THETA_X", "THETA_Y", "THETA_Z"):
+        assert rotated_slice_cache_missed(lambda: setattr(global_vars, name, 15))
+    assert rotated_slice_cache_missed(
+        lambda: setattr(global_vars, "SLICE", global_vars.SLICE + 1)
+    )
+
+
+def test_rotated_slice_cache_miss_on_interpolator_or_shrink_factor_change():
+    clear_globals()
+    initialize_globals(IMAGE_PATHS)
+    try:
+        assert rotated_slice_cache_missed(
+            lambda: global_vars.RESAMPLE_FILTER.SetInterpolator(
+                sitk.sitkNearestNeighbor
+            )
+        )
+        assert rotated_slice_cache_missed(
+            lambda: setattr(global_vars, "RESAMPLE_SHRINK_FACTOR", 2)
+        )
+    finally:
+        global_vars.RESAMPLE_FILTER.SetInterpolator(sitk.sitkLinear)
+        global_vars.RESAMPLE_SHRINK_FACTOR = 1
+
+
+def test_rotated_slice_cache_cleared_when_image_replaced_or_removed():
+    clear_globals()
+    initialize_globals(IMAGE_PATHS)
+    # orient_curr_image replaces the current image object
+    assert rotated_slice_cache_missed(lambda: orient_curr_image(View.Z))
+    get_curr_rotated_slice()
+    orient_curr_image(View.Z)
+    assert global_vars.ROTATED_SLICE_CACHE is None
+
+    get_curr_rotated_slice()
+    del_curr_img()
+    assert global_vars.ROTATED_SLICE_CACHE is None
+
+    get_curr_rotated_slice()
+    assert rotated_slice_cache_missed(lambda: initialize_globals(IMAGE_PATHS))
+    get_curr_rotated_slice()
+    initialize_globals(IMAGE_PATHS)
+    assert global_vars.ROTATED_SLICE_CACHE is None
@@ -3,21 +3,31 @@
 A lot of tests here test behavior of libraries instead of our code. This was useful when learning how
 to use the libraries, not so useful anymore.
 
-We use == for float comparison instead of |a-b|<epsilon when the numbers should be *exactly* the same."""
+Arc lengths are compared with math.isclose(a, b, abs_tol=EPSILON), not ==, so that changes to how
+length_of_contour sums its segments (which may change the last bits) don't break these tests."""
 
+import functools
+import itertools
+import math
+import os
 import SimpleITK as sitk
 import numpy as np
 import cv2
 import pytest
 from pathlib import Path
-from NeuroRuler.utils.imgproc import contour, length_of_contour
+from NeuroRuler.utils.imgproc import (
+    closed_arc_length_with_spacing,
+    contour,
+    distance_2d_with_spacing,
+    length_of_contour,
+    length_of_contour_with_spacing,
+)
 import NeuroRuler.utils.exceptions as exceptions
 from NeuroRuler.utils.constants import (
     DATA_DIR,
     SUPPORTED_IMAGE_EXTENSIONS,
     degrees_to_radians,
 )
-from NeuroRuler.utils.global_vars import READER
 from NeuroRuler.utils.img_helpers import (
     get_rotated_slice_hardcoded,
     get_center_of_rotation,
@@ -26,22 +36,149 @@ from NeuroRuler.utils.img_helpers import (
 EPSILON: float = 0.001
 """Used for `float` comparisons."""
 
-EXAMPLE_IMAGES: dict[Path, sitk.Image] = dict()
-for extension in SUPPORTED_IMAGE_EXTENSIONS:
-    for path in DATA_DIR.glob(extension):
-        READER.SetFileName(str(path))
-        EXAMPLE_IMAGES[path] = READER.Execute()
+SUPPORTED_IMAGE_SUFFIXES: tuple[str, ...] = tuple(
+    extension.lstrip("*") for extension in SUPPORTED_IMAGE_EXTENSIONS
+)
+"""E.g., ``".nii.gz"``, for use with ``str.endswith``."""
+
+
+def find_example_image_paths() -> list[Path]:
+    """Return sorted paths of the supported images in DATA_DIR in a single directory scan.
+
+    :return: paths of the example images, or [] if DATA_DIR doesn't exist
+    :rtype: list[Path]"""
+    try:
+        with os.scandir(DATA_DIR) as entries:
+            return sorted(
+                Path(entry.path)
+                for entry in entries
+                if entry.is_file() and entry.name.endswith(SUPPORTED_IMAGE_SUFFIXES)
+            )
+    except FileNotFoundError:
+        return []
+
+
+EXAMPLE_IMAGE_PATHS: list[Path] = find_example_image_paths()
+"""Paths of the example images. The images are read only when a test uses them."""
+
+
+@functools.lru_cache(maxsize=None)
+def read_example_image(path: Path) -> sitk.Image:
+    """Read the example image at path once. Later calls return the same image.
+
+    :param path:
+    :type path: Path
+    :return: image
+    :rtype: sitk.Image"""
+    return sitk.ReadImage(str(path))
+
+
+@functools.lru_cache(maxsize=256)
+def cached_rotated_slice(
+    path: Path, theta_x: int, theta_y: int, theta_z: int, slice_num: int
+) -> sitk.Image:
+    """get_rotated_slice_hardcoded for the example image at path, memoized across tests.
+
+    Several tests resample the same (image, rotation, slice), so the result is computed
+    once. Don't mutate the returned slice.
+
+    :param path: example image path, as passed to read_example_image
+    :type path: Path
+    :param theta_x:
+    :type theta_x: int
+    :param theta_y:
+    :type theta_y: int
+    :param theta_z:
+    :type theta_z: int
+    :param slice_num:
+    :type slice_num: int
+    :return: rotated slice
+    :rtype: sitk.Image"""
+    return get_rotated_slice_hardcoded(
+        read_example_image(path), theta_x, theta_y, theta_z, slice_num
+    )
+
+
+def parent_contour_arc_length(contour_slice: np.ndarray) -> float:
+    """Arc length of the same parent contour length_of_contour measures, computed with
+    closed_arc_length_with_spacing (numpy) instead of cv2.arcLength. For cross-checks.
+
+    :param contour_slice: binary (0|1) slice returned by contour()
+    :type contour_slice: np.ndarray
+    :return: arc length of the parent contour with (1, 1) spacing
+    :rtype: float"""
+    contours, hierarchy = cv2.findContours(
+        contour_slice, cv2.RETR_TREE, cv2.CHAIN_APPROX_SIMPLE
+    )
+    points: np.ndarray = contours[0].reshape(-1, 2).astype(np.float64)
+    return closed_arc_length_with_spacing(points, 1.0, 1.0)
+
+
+THETAS_SPARSE: list[tuple[int, int, int]] = [
+    (0, 0, 0),
+    (15, 0, 0),
+    (0, 15, 0),
+    (0, 0, 15),
+    (15, 15, 15),
+    (0, 30, 15),
+]
+"""Sparse (theta_x, theta_y, theta_z) sample: no rotation, each axis alone, and two mixed
+rotations. Enough for invariants that don't depend on the exact angles."""
+
+THETAS_0_TO_30: list[tuple[int, int, int]] = list(
+    itertools.product(range(0, 31, 15), repeat=3)
+)
+"""(theta_x, theta_y, theta_z) rotation grid with each angle in {0, 15, 30}."""
+
+
+@pytest.fixture(scope="session", params=EXAMPLE_IMAGE_PATHS, ids=lambda path: path.name)
+def img_path(request: pytest.FixtureRequest) -> Path:
+    """One example image path per test id, so ``pytest -n auto`` can shard by image.
+
+    Parametrized by path rather than by image so that each xdist worker reads only the
+    images of its own tests instead of receiving pickled images.
+
+    :param request:
+    :type request: pytest.FixtureRequest
+    :return: example image path
+    :rtype: Path"""
+    return request.param
+
+
+@pytest.fixture(scope="session")
+def img(img_path: Path) -> sitk.Image:
+    """Example image at img_path, read on first use.
+
+    :param img_path:
+    :type img_path: Path
+    :return: example image
+    :rtype: sitk.Image"""
+    return read_example_image(img_path)
+
+
+@pytest.fixture(scope="session")
+def img_np(img: sitk.Image) -> np.ndarray:
+    """Zero-copy numpy view of img, indexed [z][y][x], so ``img_np[z]`` is slice z
+    without extracting it through sitk.
+
+    :param img:
+    :type img: sitk.Image
+    :return: view of img
+    :rtype: np.ndarray"""
+    return sitk.GetArrayViewFromImage(img)
 
 
 @pytest.mark.skip(reason="Doesn't need to run again unless new images are added")
-def test_all_images_min_value_0_max_value_less_than_1600():
-    for img in EXAMPLE_IMAGES.values():
-        img_np: np.ndarray = sitk.GetArrayFromImage(img)
-        assert img_np.min() == 0 and img_np.max() < 1600
+def test_all_images_min_value_0_max_value_less_than_1600(img: sitk.Image):
+    min_max_filter = sitk.MinimumMaximumImageFilter()
+    min_max_filter.Execute(img)
+    assert min_max_filter.GetMinimum() == 0 and min_max_filter.GetMaximum() < 1600
 
 
 @pytest.mark.skip(reason="Doesn't need to run again")
-def test_dimensions_of_np_array_same_as_original_image_but_transposed():
+def test_dimensions_of_np_array_same_as_original_image_but_transposed(
+    img: sitk.Image, img_np: np.ndarray
+):
     """Probably not needed but just in case.
 
     The dimensions of the numpy array are the same as the original image.
@@ -50,141 +187,136 @@ def test_dimensions_of_np_array_same_as_original_image_but_transposed():
 
     Pretty sure that means the arc length generated from the numpy array is the arc length of the original image, with the same units as the original image.
     """
-    for img in EXAMPLE_IMAGES.values():
-        for slice_z in range(img.GetSize()[2] // 5):
-            slice = img[:, :, slice_z]
-            # Transposed
-            np_slice = sitk.GetArrayFromImage(slice)
+    img_size: tuple = img.GetSize()
+    for slice_z in range(img_size[2] // 5):
+        # Transposed
+        np_slice = img_np[slice_z]
 
-            assert slice.GetSize()[0] == np_slice.shape[1]
-            assert slice.GetSize()[1] == np_slice.shape[0]
+        assert img_size[0] == np_slice.shape[1]
+        assert img_size[1] == np_slice.shape[0]
 
 
 @pytest.mark.skip(reason="Doesn't need to run again")
-def test_numpy_2D_slice_array_is_transpose_of_sitk_2D_slice_array():
+def test_numpy_2D_slice_array_is_transpose_of_sitk_2D_slice_array(
+    img: sitk.Image, img_np: np.ndarray
+):
     """Confirm that the numpy matrix representation of a 2D slice is the transpose of the sitk matrix representation of a slice.
 
     Can ignore this test later."""
-    for img in EXAMPLE_IMAGES.values():
-        for z_slice in range(img.GetSize()[2] // 5):
-            slice_sitk: sitk.Image = img[:, :, z_slice]
-            slice_np: np.ndarray = sitk.GetArrayFromImage(slice_sitk)
-
-            for i in range(slice_np.shape[0]):
-                for j in range(slice_np.shape[1]):
-                    assert slice_np[i][j] == slice_sitk.GetPixel(j, i)
+    # img_np[z][i][j] is sitk pixel (j, i, z), which is pixel (j, i) of slice z
+    rng: np.random.Generator = np.random.default_rng(0)
+    for z_slice in range(img.GetSize()[2] // 5):
+        slice_sitk: sitk.Image = img[:, :, z_slice]
+        slice_np: np.ndarray = sitk.GetArrayViewFromImage(slice_sitk)
+
+        assert slice_np.shape == slice_sitk.GetSize()[::-1]
+        assert np.array_equal(slice_np, img_np[z_slice])
+        # Full check: swapping sitk's x and y axes, then transposing in numpy, gives the same array back
+        assert np.array_equal(
+            sitk.GetArrayFromImage(sitk.PermuteAxes(slice_sitk, [1, 0])).T, slice_np
+        )
+        # Spot check the transpose against sitk itself, not just another numpy view
+        for i, j in zip(
+            rng.integers(slice_np.shape[0], size=20).tolist(),
+            rng.integers(slice_np.shape[1], size=20).tolist(),
+        ):
+            assert slice_np[i][j] == slice_sitk.GetPixel(j, i)
 
 
 @pytest.mark.skip(reason="Doesn't need to run for a while")
-def test_contour_doesnt_mutate_slice():
+def test_contour_doesnt_mutate_slice(img: sitk.Image):
     """Test that contour() doesn't mutate its argument."""
-    for img in EXAMPLE_IMAGES.values():
-        for slice_num in range(img.GetSize()[2] // 3):
-            rotated_slice: sitk.Image = get_rotated_slice_hardcoded(
-                img, 0, 0, 0, slice_num
-            )
-            rotated_slice_copy: sitk.Image = get_rotated_slice_hardcoded(
-                img, 0, 0, 0, slice_num
-            )
-            contour(rotated_slice)
-            for i in range(rotated_slice.GetSize()[0]):
-                for j in range(rotated_slice.GetSize()[1]):
-                    assert rotated_slice.GetPixel(i, j) == rotated_slice_copy.GetPixel(
-                        i, j
-                    )
-
-
-@pytest.mark.skip(reason="Doesn't need to run again")
-def test_contour_returns_binary_slice():
-    """Test that the contour function always returns a binary (0|1) slice."""
-    for img in EXAMPLE_IMAGES.values():
-        for slice_num in range(img.GetSize()[2] // 5):
-            rotated_slice = get_rotated_slice_hardcoded(img, 0, 0, 0, slice_num)
-            contour_slice_np: np.ndarray = contour(rotated_slice)
-            assert contour_slice_np.min() <= 1 and contour_slice_np.max() <= 1
-
-
-@pytest.mark.skip(reason="Doesn't need to run again")
-def test_contour_retranspose_has_same_dimensions_as_original_image():
-    for img in EXAMPLE_IMAGES.values():
-        for theta_x in range(0, 30, 15):
-            for theta_y in range(0, 30, 15):
-                for theta_z in range(0, 30, 15):
-                    for slice_num in range(img.GetSize()[2] // 3):
-                        rotated_slice = get_rotated_slice_hardcoded(
-                            img, theta_x, theta_y, theta_z, slice_num
-                        )
-                        contour_slice: np.ndarray = contour(rotated_slice)
-                        assert (
-                            contour_slice.shape[0] == img.GetSize()[0]
-                            and contour_slice.shape[1] == img.GetSize()[1]
-                        )
+    size_x, size_y, size_z = img.GetSize()
+    for slice_num in range(size_z // 3):
+        rotated_slice: sitk.Image = get_rotated_slice_hardcoded(img, 0, 0, 0, slice_num)
+        rotated_slice_copy: sitk.Image = get_rotated_slice_hardcoded(
+            img, 0, 0, 0, slice_num
+        )
+        contour(rotated_slice)
+        # The slice is a plane of img, so it's size_x by size_y
+        for i in range(size_x):
+            for j in range(size_y):
+                assert rotated_slice.GetPixel(i, j) == rotated_slice_copy.GetPixel(i, j)
 
 
 @pytest.mark.skip(reason="This should be run again later")
-def test_length_of_contour_doesnt_mutate_contour():
-    for img in EXAMPLE_IMAGES.values():
-        for slice_num in range(img.GetSize()[2] // 10):
-            rotated_slice: sitk.Image = get_rotated_slice_hardcoded(
-                img, 0, 0, 0, slice_num
-            )
-            contour_slice: np.ndarray = contour(rotated_slice)
-            contour_slice_copy: np.ndarray = contour_slice.copy()
-            length_of_contour(contour_slice, False)
-            assert np.array_equal(contour_slice, contour_slice_copy)
-
+def test_contour_invariants(img_path: Path, img: sitk.Image):
+    """Test invariants of contour() on unrotated slices, computing each contour once.
 
-@pytest.mark.skip(reason="Doesn't need to run again")
-def test_contours_0_is_always_parent_contour_if_no_islands():
-    """Assuming there are no islands in the image, then contours[0] results in the parent contour.
+    1. contour() returns a binary (0|1) slice.
+    2. length_of_contour() doesn't mutate the contour.
+    3. Assuming there are no islands in the image, then contours[0] results in the parent contour.
 
     See documentation on our wiki page about hierarchy. tl;dr hierarchy[0][i] returns information about the i'th contour.
     hierarchy[0][i][3] is information about the parent contour of the i'th contour. So if hierarchy[0][0][3] = -1, then the 0'th contour is the parent.
     """
-    for img in EXAMPLE_IMAGES.values():
-        for slice_num in range(img.GetSize()[2] // 7):
-            rotated_slice: sitk.Image = get_rotated_slice_hardcoded(
-                img, 0, 0, 0, slice_num
-            )
-            # contour removes islands
-            contour_slice: np.ndarray = contour(rotated_slice)
-            contours, hierarchy = cv2.findContours(
-                contour_slice, cv2.RETR_TREE, cv2.CHAIN_APPROX_SIMPLE
-            )
-            assert hierarchy[0][0][3] == -1
+    for slice_num in range(img.GetSize()[2] // 5):
+        rotated_slice: sitk.Image = cached_rotated_slice(img_path, 0, 0, 0, slice_num)
+        # contour removes islands
+        contour_slice: np.ndarray = contour(rotated_slice)
+        # uint8 can't be negative, so one reduction is enough for 0|1
+        assert contour_slice.dtype == np.uint8 and contour_slice.max() <= 1
+
+        contour_slice_copy: np.ndarray = contour_slice.copy()
+        length_of_contour(contour_slice, False)
+        assert np.array_equal(contour_slice, contour_slice_copy)
+
+        # Same retrieval mode as length_of_contour. RETR_EXTERNAL would be cheaper, but
+        # it sets every parent to -1, so the check would pass trivially.
+        # The approximation method doesn't affect the hierarchy, only the points kept
+        contours, hierarchy = cv2.findContours(
+            contour_slice, cv2.RETR_TREE, cv2.CHAIN_APPROX_TC89_KCOS
+        )
+        assert hierarchy[0][0][3] == -1
 
 
 @pytest.mark.skip(reason="Doesn't need to run again")
-def test_arc_length_of_copy_after_transpose_same_as_no_copy_after_transpose():
-    """Test arc length of two re-transposed arrays is the same when calling .copy() on one but not the other."""
-    for img in EXAMPLE_IMAGES.values():
-        for theta_x in range(0, 30, 15):
-            for theta_y in range(0, 30, 15):
-                for theta_z in range(0, 30, 15):
-                    for slice_num in range(0, img.GetSize()[2], img.GetSize()[2] // 10):
-                        rotated_slice: sitk.Image = get_rotated_slice_hardcoded(
-                            img, theta_x, theta_y, theta_z, slice_num
-                        )
-                        contour_slice_retransposed_not_copied = contour(rotated_slice)
-                        # The below duplicates work but it's to be safe
-                        contour_slice_retransposed_copied = contour(
-                            rotated_slice
-                        ).copy()
-
-                        # Assumes it's a closed curve but it might not be
-                        length_of_not_copied = length_of_contour(
-                            contour_slice_retransposed_not_copied, False
-                        )
-                        length_of_copied = length_of_contour(
-                            contour_slice_retransposed_copied, False
-                        )
-                        assert length_of_not_copied == length_of_copied
+@pytest.mark.parametrize("theta_x, theta_y, theta_z", THETAS_SPARSE)
+def test_contour_retranspose_has_same_dimensions_as_original_image(
+    img_path: Path, img: sitk.Image, theta_x: int, theta_y: int, theta_z: int
+):
+    size_x, size_y, size_z = img.GetSize()
+    for slice_num in range(size_z // 3):
+        rotated_slice = cached_rotated_slice(
+            img_path, theta_x, theta_y, theta_z, slice_num
+        )
+        contour_slice: np.ndarray = contour(rotated_slice)
+        assert contour_slice.shape[0] == size_x and contour_slice.shape[1] == size_y
+
+
+@pytest.mark.skip(reason="Doesn't need to run again")
+@pytest.mark.parametrize("theta_x, theta_y, theta_z", [(0, 0, 0), (15, 15, 15)])
+def test_arc_length_of_copy_after_transpose_same_as_no_copy_after_transpose(
+    img_path: Path, img: sitk.Image, theta_x: int, theta_y: int, theta_z: int
+):
+    """Test arc length of two re-transposed arrays is the same when calling .copy() on one but not the other.
+
+    Whether the array is a copy depends only on its memory layout, not on the rotation that
+    produced the slice, so one unrotated and one rotated case are enough."""
+    size_z: int = img.GetSize()[2]
+    for slice_num in range(0, size_z, size_z // 10):
+        rotated_slice: sitk.Image = cached_rotated_slice(
+            img_path, theta_x, theta_y, theta_z, slice_num
+        )
+        contour_slice_retransposed_not_copied = contour(rotated_slice)
+        # The below duplicates work but it's to be safe
+        contour_slice_retransposed_copied = contour(rotated_slice).copy()
+
+        # Assumes it's a closed curve but it might not be
+        length_of_not_copied = length_of_contour(
+            contour_slice_retransposed_not_copied, False
+        )
+        length_of_copied = length_of_contour(contour_slice_retransposed_copied, False)
+        assert math.isclose(length_of_not_copied, length_of_copied, abs_tol=EPSILON)
 
 
 @pytest.mark.skip(
     reason="User can see in the GUI the contour generated to confirm its accuracy. Also, this won't matter except for edge cases where the slice is invalid"
 )
-def test_arc_length_of_transposed_matrix_is_same_except_for_invalid_slice():
+@pytest.mark.parametrize("theta_x, theta_y, theta_z", THETAS_0_TO_30)
+def test_arc_length_of_transposed_matrix_is_same_except_for_invalid_slice(
+    img_path: Path, img: sitk.Image, theta_x: int, theta_y: int, theta_z: int
+):
     """Per discussion here https://github.com/NIRALUser/NeuroRuler/commit/a230a6b57dc34ec433e311d760cc53841ddd6a49,
 
     Test that the arc length of a contour and its transpose is the same in a specific case. It probably generalizes to the general case.
@@ -197,31 +329,34 @@ def test_arc_length_of_transposed_matrix_is_same_except_for_invalid_slice():
 
     But the pixel spacing of the underlying `np.ndarray` passed into cv2.findContours *seems* to be fine. See discussion in the GH link.
 
+    Invalid slices raise exceptions.ComputeCircumferenceOfInvalidSlice. They're skipped, and the test
+    is reported as xfail with the list of invalid slices if there were any.
+
     TODO: Unit test with pre-computed circumferences to really confirm this."""
-    for img in EXAMPLE_IMAGES.values():
-        # f.write(f"{DATA_DIR.name}/{img.path.name}\n")
-        for theta_x in range(0, 31, 15):
-            for theta_y in range(0, 31, 15):
-                for theta_z in range(0, 31, 15):
-                    for slice_num in range(0, img.GetSize()[2]):
-                        rotated_slice: sitk.Image = get_rotated_slice_hardcoded(
-                            img, theta_x, theta_y, theta_z, slice_num
-                        )
-                        contour_slice: np.ndarray = contour(rotated_slice)
-                        # .copy() probably isn't needed if above test passes
-                        contour_slice_transposed: np.ndarray = np.transpose(
-                            contour_slice
-                        )
-                        try:
-                            length_1 = length_of_contour(contour_slice)
-                            length_2 = length_of_contour(contour_slice_transposed)
-                            assert length_1 == length_2
-                        except exceptions.ComputeCircumferenceOfInvalidSlice:
-                            pass
+    invalid_slices: list[int] = []
+    for slice_num in range(img.GetSize()[2]):
+        rotated_slice: sitk.Image = cached_rotated_slice(
+            img_path, theta_x, theta_y, theta_z, slice_num
+        )
+        contour_slice: np.ndarray = contour(rotated_slice)
+        # .copy() probably isn't needed if above test passes
+        contour_slice_transposed: np.ndarray = np.transpose(contour_slice)
+        try:
+            length_1 = length_of_contour(contour_slice)
+            length_2 = length_of_contour(contour_slice_transposed)
+        except exceptions.ComputeCircumferenceOfInvalidSlice:
+            invalid_slices.append(slice_num)
+            continue
+        assert math.isclose(length_1, length_2, abs_tol=EPSILON)
+    if invalid_slices:
+        pytest.xfail(f"Invalid slices {invalid_slices}")
 
 
 @pytest.mark.skip(reason="")
-def test_contour_slice_retranspose_same_dimensions_as_original_slice():
+@pytest.mark.parametrize("theta_x, theta_y, theta_z", THETAS_0_TO_30)
+def test_contour_slice_retranspose_same_dimensions_as_original_slice(
+    img_path: Path, img: sitk.Image, theta_x: int, theta_y: int, theta_z: int
+):
     """Test that the np array generated after contouring has the same dimensions as the original
     sitk slice.
 
@@ -242,37 +377,101 @@ def test_contour_slice_retranspose_same_dimensions_as_original_slice():
     Regarding 1, given that the GUI displays an image with correct aspect ratio, is the arc length of the
     sitk image the same as that of the physical brain?
     """
-    for img in EXAMPLE_IMAGES.values():
-        original_dimensions: tuple = img.GetSize()
-        for theta_x in range(0, 31, 15):
-            for theta_y in range(0, 31, 15):
-                for theta_z in range(0, 31, 15):
-                    for slice_num in range(
-                        0, original_dimensions[2], original_dimensions[2] // 4
-                    ):
-                        rotated_slice: sitk.Image = get_rotated_slice_hardcoded(
-                            img, theta_x, theta_y, theta_z, slice_num
-                        )
-                        binary_contour = contour(rotated_slice)
-                        assert (
-                            original_dimensions[0] == binary_contour.shape[0]
-                            and original_dimensions[1] == binary_contour.shape[1]
-                        )
+    original_dimensions: tuple = img.GetSize()
+    for slice_num in range(0, original_dimensions[2], original_dimensions[2] // 4):
+        rotated_slice: sitk.Image = cached_rotated_slice(
+            img_path, theta_x, theta_y, theta_z, slice_num
+        )
+        binary_contour = contour(rotated_slice)
+        assert (
+            original_dimensions[0] == binary_contour.shape[0]
+            and original_dimensions[1] == binary_contour.shape[1]
+        )
 
 
 @pytest.mark.skip(reason="Passed locally, doesn't need to run again")
-def test_rotation_doesnt_affect_spacing():
-    img = list(EXAMPLE_IMAGES.values())[0]
+@pytest.mark.parametrize(
+    "theta_x, theta_y, theta_z", list(itertools.product(range(0, 100, 25), repeat=3))
+)
+def test_rotation_doesnt_affect_spacing(theta_x: int, theta_y: int, theta_z: int):
+    img = read_example_image(EXAMPLE_IMAGE_PATHS[0])
     e3d = sitk.Euler3DTransform()
     e3d.SetCenter(get_center_of_rotation(img))
-    spacing = img.GetSpacing()
-    for theta_x in range(0, 100, 25):
-        for theta_y in range(0, 100, 25):
-            for theta_z in range(0, 100, 25):
-                e3d.SetRotation(
-                    degrees_to_radians(theta_x),
-                    degrees_to_radians(theta_y),
-                    degrees_to_radians(theta_z),
-                )
-                new_img = sitk.Resample(img, e3d)
-                assert new_img.GetSpacing() == spacing
+    e3d.SetRotation(
+        degrees_to_radians(theta_x),
+        degrees_to_radians(theta_y),
+        degrees_to_radians(theta_z),
+    )
+    new_img = sitk.Resample(img, e3d)
+    assert new_img.GetSpacing() == img.GetSpacing()
+
+
+def ellipse_contour_slice() -> np.ndarray:
+    """Binary (0|1) uint8 slice with a single closed elliptical contour, like the RV of contour(),
+    for tests that don't need the example images.
+
+    :return: binary slice
+    :rtype: np.ndarray"""
+    binary_slice: np.ndarray = np.zeros((120, 160), dtype=np.uint8)
+    cv2.ellipse(binary_slice, (80, 60), (50, 35), 20, 0, 360, 1, 1)
+    return binary_slice
+
+
+def test_closed_arc_length_with_spacing_known_answers():
+    unit_square: np.ndarray = np.array(
+        [[0, 0], [1, 0], [1, 1], [0, 1]], dtype=np.float64
+    )
+    assert math.isclose(
+        closed_arc_length_with_spacing(unit_square, 1.0, 1.0), 4, abs_tol=EPSILON
+    )
+    # x edges are 2 long and y edges are 3 long
+    assert math.isclose(
+        closed_arc_length_with_spacing(unit_square, 2.0, 3.0), 10, abs_tol=EPSILON
+    )
+    # Closing the curve goes back to the first point, so the segment is counted twice
+    two_points: np.ndarray = np.array([[0, 0], [3, 4]], dtype=np.float64)
+    assert math.isclose(
+        closed_arc_length_with_spacing(two_points, 1.0, 1.0), 10, abs_tol=EPSILON
+    )
+    assert math.isclose(
+        closed_arc_length_with_spacing(two_points, 2.0, 3.0),
+        2 * math.hypot(6, 12),
+        abs_tol=EPSILON,
+    )
+
+
+def test_length_of_contour_with_spacing_same_as_point_by_point_loop():
+    """length_of_contour_with_spacing is the same as summing distance_2d_with_spacing over the
+    points of the parent contour, which is how it used to be computed."""
+    binary_slice: np.ndarray = ellipse_contour_slice()
+    contours, hierarchy = cv2.findContours(
+        binary_slice, cv2.RETR_TREE, cv2.CHAIN_APPROX_TC89_L1
+    )
+    parent_contour: np.ndarray = contours[0]
+    for x_spacing, y_spacing in ((1.0, 1.0), (0.7, 1.3), (2.0, 3.0)):
+        expected: float = 0
+        for i in range(len(parent_contour) - 1):
+            expected += distance_2d_with_spacing(
+                parent_contour[i][0], parent_contour[i + 1][0], x_spacing, y_spacing
+            )
+        expected += distance_2d_with_spacing(
+            parent_contour[-1][0], parent_contour[0][0], x_spacing, y_spacing
+        )
+        assert math.isclose(
+            length_of_contour_with_spacing(binary_slice, x_spacing, y_spacing),
+            expected,
+            abs_tol=EPSILON,
+        )
+
+
+def test_length_of_contour_same_as_numpy_arc_length():
+    """length_of_contour (cv2.arcLength) is the same as closed_arc_length_with_spacing over the
+    same parent contour, for the slice and its transpose."""
+    binary_slice: np.ndarray = ellipse_contour_slice()
+    for contour_slice in (binary_slice, np.ascontiguousarray(binary_slice.T)):
+        # cv2.arcLength sums float32 distances, so only equal up to EPSILON
+        assert math.isclose(
+            length_of_contour(contour_slice, False),
+            parent_contour_arc_length(contour_slice),
+            abs_tol=EPSILON,
+        )
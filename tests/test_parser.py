@@ -0,0 +1,69 @@
+"""Tests for ``scan_gui_cli``, which should produce the same namespace as argparse for the args it handles
+and return None (falling back to argparse) for everything else."""
+
+import pytest
+from NeuroRuler.utils.parser import GUI_CLI_OPTIONS, gui_cli_argparser, scan_gui_cli
+
+OPTION_VALUES: dict[str, list[str]] = {
+    "debug": [],
+    "theme": ["dark"],
+    "color": ["red"],
+}
+
+
+@pytest.mark.parametrize("option", GUI_CLI_OPTIONS)
+def test_scan_gui_cli_same_as_argparse_for_each_option(option: str):
+    argv: list[str] = [option] + OPTION_VALUES[GUI_CLI_OPTIONS[option]]
+    assert vars(scan_gui_cli(argv)) == vars(gui_cli_argparser().parse_args(argv))
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        [],
+        ["-d", "-t", "dark", "--color", "red"],
+        ["--color", "00ff00", "--debug", "--theme", "light"],
+        ["-t", "dark", "-t", "light"],
+        ["-d", "--debug"],
+    ],
+)
+def test_scan_gui_cli_same_as_argparse_for_combined_options(argv: list[str]):
+    assert vars(scan_gui_cli(argv)) == vars(gui_cli_argparser().parse_args(argv))
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["--theme=dark"],
+        ["-tdark"],
+        ["-d", "--color=red"],
+        ["-dt", "dark"],
+    ],
+)
+def test_scan_gui_cli_falls_back_to_argparse_for_valid_args_it_doesnt_handle(
+    argv: list[str],
+):
+    assert scan_gui_cli(argv) is None
+    # argparse still parses these
+    gui_cli_argparser().parse_args(argv)
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["-h"],
+        ["--help"],
+        ["-x"],
+        ["-t"],
+        ["-t", "-d"],
+        ["-d", "--color"],
+        ["file.nrrd"],
+    ],
+)
+def test_scan_gui_cli_falls_back_to_argparse_for_help_and_invalid_args(
+    argv: list[str],
+):
+    assert scan_gui_cli(argv) is None
+    # argparse prints help or an error and exits
+    with pytest.raises(SystemExit):
+        gui_cli_argparser().parse_args(argv)